@@ -3,7 +3,11 @@
 ```python
 import random
 import logging
-from typing import List, Tuple, Dict, Optional
+import sys
+import timeit
+from array import array
+from collections import deque
+from typing import Iterator, List, Tuple, Dict, Optional
 
 # Configure logging
 logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s', level=logging.INFO)
@@ -34,6 +38,13 @@ class BinaryTree:
 
     def __init__(self, root: Optional[Node] = None) -> None:
         self.root = root
+        # Number of nodes, or None until counted when the tree was built from a given root
+        self._size = 0 if root is None else None
+
+    def __len__(self) -> int:
+        if self._size is None:
+            self._size = sum(1 for _ in self.iter_preorder())
+        return self._size
 
     def insert(self, value: int) -> None:
         """
@@ -43,6 +54,8 @@ class BinaryTree:
             value: The value to insert.
         """
 
+        if self._size is not None:
+            self._size += 1
         if self.root is None:
             self.root = Node(value)
         else:
@@ -121,6 +134,9 @@ class BinaryTree:
             self._delete(value, self.root)
         except ValueError:
             logging.error(f"Node with value {value} not found")
+        else:
+            if self._size is not None:
+                self._size -= 1
 
     def _delete(self, value: int, node: Node) -> None:
         """
@@ -259,6 +275,96 @@ class BinaryTree:
             self._print_postorder(node.right)
         print(node.value)
 
+    def iter_preorder(self) -> Iterator[int]:
+        """
+        Yields the values of the tree in preorder traversal order.
+
+        Uses an explicit stack, so extra memory is O(height) and deep trees never hit the
+        recursion limit.
+        """
+
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def iter_inorder(self) -> Iterator[int]:
+        """
+        Yields the values of the tree in inorder traversal order, using O(height) extra memory.
+        """
+
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def iter_postorder(self) -> Iterator[int]:
+        """
+        Yields the values of the tree in postorder traversal order, using O(height) extra memory.
+        """
+
+        stack = []
+        node = self.root
+        last = None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                node = top.right
+            else:
+                stack.pop()
+                yield top.value
+                last = top
+
+    def iter_levelorder(self) -> Iterator[int]:
+        """
+        Yields the values of the tree level by level, from left to right.
+
+        The queue holds at most one level of the tree at a time.
+        """
+
+        queue = deque([self.root] if self.root is not None else [])
+        while queue:
+            node = queue.popleft()
+            yield node.value
+            if node.left is not None:
+                queue.append(node.left)
+            if node.right is not None:
+                queue.append(node.right)
+
+    def to_array(self) -> array:
+        """
+        Exports the values of the tree in sorted (inorder) order.
+
+        Returns:
+            An array('q') preallocated to the size of the tree and filled in one traversal.
+        """
+
+        values = array('q', bytes(8 * len(self)))
+        i = 0
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            values[i] = node.value
+            i += 1
+            node = node.right
+        return values
+
     def is_balanced(self) -> bool:
         """
         Checks if the tree is balanced.
@@ -293,4 +399,269 @@ class BinaryTree:
 
         return abs(left_height - right_height) <= 1 and self._is_balanced(node.left) and self._is_balanced(node.right)
 
-    def _get_height(self, node: Optional[Node]) -> int
\ No newline at end of file
+    def _get_height(self, node: Optional[Node]) -> int:
+        """
+        Computes the height of the subtree rooted at the given node.
+
+        Args:
+            node: The root of the subtree.
+
+        Returns:
+            The number of nodes on the longest path from the node down to a leaf (0 for None).
+        """
+
+        if node is None:
+            return 0
+
+        return 1 + max(self._get_height(node.left), self._get_height(node.right))
+
+
+class AVLNode(Node):
+    """
+    A node in an AVL tree.
+
+    Attributes:
+        value: The value stored in the node.
+        left: The left child node.
+        right: The right child node.
+        height: The height of the subtree rooted at this node.
+    """
+
+    def __init__(self, value: int, left: Optional['AVLNode'] = None, right: Optional['AVLNode'] = None) -> None:
+        super().__init__(value, left, right)
+        self.height = 1
+
+
+def _height(node: Optional[AVLNode]) -> int:
+    return node.height if node is not None else 0
+
+
+def _update_height(node: AVLNode) -> None:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+def _rotate_right(node: AVLNode) -> AVLNode:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
+
+
+def _rotate_left(node: AVLNode) -> AVLNode:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update_height(node)
+    _update_height(pivot)
+    return pivot
+
+
+def _rebalance(node: AVLNode) -> AVLNode:
+    """
+    Restores the AVL property at the given node after one of its subtrees changed height.
+
+    Args:
+        node: The node to rebalance.
+
+    Returns:
+        The new root of the subtree.
+    """
+
+    _update_height(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class AVLTree(BinaryTree):
+    """
+    A self-balancing (AVL) binary search tree.
+
+    Every node stores the height of its subtree, and insertions and deletions rotate
+    nodes on the way back up so that sibling subtree heights never differ by more than
+    one. All operations are iterative and take O(log n) time, so sorted input neither
+    degrades the tree nor hits the recursion limit.
+
+    Attributes:
+        root: The root node of the tree.
+    """
+
+    def _relink(self, path: List[AVLNode]) -> None:
+        """
+        Rebalances every node on a root-to-node path, from the bottom up.
+
+        Args:
+            path: The nodes visited on the way down, starting at the root.
+        """
+
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            subtree = _rebalance(node)
+            if i == 0:
+                self.root = subtree
+            elif path[i - 1].left is node:
+                path[i - 1].left = subtree
+            else:
+                path[i - 1].right = subtree
+            if subtree is node and node.height == old_height:
+                # Nothing above this node can have changed
+                break
+
+    def insert(self, value: int) -> None:
+        """
+        Inserts a new node with the given value into the tree.
+
+        Args:
+            value: The value to insert.
+        """
+
+        if self._size is not None:
+            self._size += 1
+        if self.root is None:
+            self.root = AVLNode(value)
+            return
+
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = AVLNode(value)
+        else:
+            parent.right = AVLNode(value)
+        self._relink(path)
+
+    def find(self, value: int) -> Optional[AVLNode]:
+        """
+        Finds the node with the given value in the tree.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            The node with the given value, or None if the value is not found.
+        """
+
+        node = self.root
+        while node is not None and node.value != value:
+            node = node.left if value < node.value else node.right
+        return node
+
+    def delete(self, value: int) -> None:
+        """
+        Deletes the node with the given value from the tree.
+
+        Args:
+            value: The value to delete.
+        """
+
+        path = []
+        node = self.root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        if node is None:
+            if self.root is not None:
+                logging.error(f"Node with value {value} not found")
+            return
+        if self._size is not None:
+            self._size -= 1
+
+        if node.left is not None and node.right is not None:
+            # Replace the value with that of the smallest node in the right subtree,
+            # then remove that node instead
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+            return
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self._relink(path)
+
+    def is_balanced(self) -> bool:
+        """
+        Checks if the tree is balanced.
+
+        The AVL rotations keep every node balanced, so this holds by construction and
+        takes O(1) time.
+
+        Returns:
+            True.
+        """
+
+        return True
+
+
+def benchmark(n: int = 1_000_000) -> None:
+    """
+    Times inserting n sorted and n random keys into an AVLTree.
+
+    Args:
+        n: The number of keys to insert.
+    """
+
+    keys = list(range(n))
+    shuffled = keys[:]
+    random.shuffle(shuffled)
+    for label, values in (("sorted", keys), ("random", shuffled)):
+        tree = AVLTree()
+        start = timeit.default_timer()
+        for value in values:
+            tree.insert(value)
+        elapsed = timeit.default_timer() - start
+        logging.info(f"AVLTree: inserted {n} {label} keys in {elapsed:.2f}s (height {tree.root.height})")
+
+
+def benchmark_traversals(n: int = 10_000_000) -> None:
+    """
+    Times the generator traversals and to_array on a degenerate (linked-list shaped)
+    tree of n nodes, far deeper than the recursion limit.
+
+    Args:
+        n: The number of nodes.
+    """
+
+    root = None
+    for value in range(n - 1, -1, -1):
+        root = Node(value, right=root)
+    tree = BinaryTree(root)
+    for name in ("iter_preorder", "iter_inorder", "iter_postorder", "iter_levelorder"):
+        start = timeit.default_timer()
+        count = sum(1 for _ in getattr(tree, name)())
+        logging.info(f"{name}: {count} nodes in {timeit.default_timer() - start:.2f}s")
+    start = timeit.default_timer()
+    values = tree.to_array()
+    logging.info(f"to_array: {len(values)} values in {timeit.default_timer() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    if "--traversals" in sys.argv:
+        benchmark_traversals()
+    else:
+        benchmark()
+```
\ No newline at end of file
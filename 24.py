@@ -3,7 +3,12 @@
 ```python
 import random
 import logging
+import sys
+import threading
+import time
+import tracemalloc
 import typing
+from array import array
 
 logging.basicConfig(level=logging.DEBUG, filename='app.log', format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -12,6 +17,7 @@ class Node:
         self.value = value
         self.left = None
         self.right = None
+        self.parent = None
 
 class BinarySearchTree:
     def __init__(self):
@@ -27,12 +33,14 @@ class BinarySearchTree:
             if value < current.value:
                 if not current.left:
                     current.left = Node(value)
+                    current.left.parent = current
                     return
                 else:
                     current = current.left
             else:
                 if not current.right:
                     current.right = Node(value)
+                    current.right.parent = current
                     return
                 else:
                     current = current.right
@@ -69,7 +77,10 @@ class BinarySearchTree:
         successor = self._get_successor(node)
         logging.debug(f'Successor of node {node.value} is {successor.value}')
         node.value = successor.value
-        self._delete_node(successor)
+        if successor.right:
+            self._transplant_node(successor, successor.right)
+        else:
+            self._delete_node(successor)
 
     def _get_successor(self, node: Node) -> Node:
         current = node.right
@@ -94,18 +105,366 @@ class BinarySearchTree:
         else:
             node.parent.right = None
 
-if __name__ == '__main__':
-    bst = BinarySearchTree()
-    values = [random.randint(0, 100) for _ in range(10)]
+    def inorder_traversal(self) -> typing.Iterator[Node]:
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current
+            current = current.right
+
+NIL = -1
+
+class PoolNode:
+    """Lightweight view of one slot in an ArrayBinarySearchTree, mirroring the Node attributes."""
+    __slots__ = ('_tree', 'index')
+
+    def __init__(self, tree: 'ArrayBinarySearchTree', index: int):
+        self._tree = tree
+        self.index = index
+
+    def _view(self, index: int) -> typing.Optional['PoolNode']:
+        return PoolNode(self._tree, index) if index != NIL else None
+
+    @property
+    def value(self) -> int:
+        return self._tree._keys[self.index]
+
+    @property
+    def left(self) -> typing.Optional['PoolNode']:
+        return self._view(self._tree._left[self.index])
+
+    @property
+    def right(self) -> typing.Optional['PoolNode']:
+        return self._view(self._tree._right[self.index])
+
+    @property
+    def parent(self) -> typing.Optional['PoolNode']:
+        return self._view(self._tree._parent[self.index])
+
+class ArrayBinarySearchTree:
+    """
+    BinarySearchTree with the same insert/search/delete/inorder_traversal API whose nodes live in a pool
+    of parallel int64 columns (key, left, right, parent) instead of one Python object per node.
+
+    Child and parent links are slot indices with NIL for "none". Deleted slots are chained into a free
+    list through the left column and reused by later inserts. Keys must fit in a signed 64-bit integer.
+    """
+
+    def __init__(self):
+        self._keys = array('q')
+        self._left = array('q')
+        self._right = array('q')
+        self._parent = array('q')
+        self._root = NIL
+        self._free = NIL
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def root(self) -> typing.Optional[PoolNode]:
+        return PoolNode(self, self._root) if self._root != NIL else None
+
+    def _allocate(self, value: int, parent: int) -> int:
+        if self._free != NIL:
+            index = self._free
+            self._free = self._left[index]
+            self._keys[index] = value
+            self._left[index] = NIL
+            self._right[index] = NIL
+            self._parent[index] = parent
+        else:
+            index = len(self._keys)
+            self._keys.append(value)
+            self._left.append(NIL)
+            self._right.append(NIL)
+            self._parent.append(parent)
+        self._count += 1
+        return index
+
+    def _release(self, index: int):
+        self._left[index] = self._free
+        self._free = index
+        self._count -= 1
+
+    def insert(self, value: int):
+        if self._root == NIL:
+            self._root = self._allocate(value, NIL)
+            return
+
+        keys, left, right = self._keys, self._left, self._right
+        current = self._root
+        while True:
+            if value < keys[current]:
+                if left[current] == NIL:
+                    left[current] = self._allocate(value, current)
+                    return
+                current = left[current]
+            else:
+                if right[current] == NIL:
+                    right[current] = self._allocate(value, current)
+                    return
+                current = right[current]
+
+    def _find(self, value: int) -> int:
+        keys, left, right = self._keys, self._left, self._right
+        current = self._root
+        while current != NIL:
+            key = keys[current]
+            if value == key:
+                return current
+            current = left[current] if value < key else right[current]
+        return NIL
+
+    def search(self, value: int) -> typing.Optional[PoolNode]:
+        index = self._find(value)
+        return PoolNode(self, index) if index != NIL else None
+
+    def delete(self, value: int):
+        index = self._find(value)
+        if index == NIL:
+            logging.warning(f'Node with value {value} not found')
+            return
+
+        left, right = self._left, self._right
+        if left[index] != NIL and right[index] != NIL:
+            successor = right[index]
+            while left[successor] != NIL:
+                successor = left[successor]
+            logging.debug(f'Successor of node {self._keys[index]} is {self._keys[successor]}')
+            self._keys[index] = self._keys[successor]
+            index = successor
+
+        child = left[index] if left[index] != NIL else right[index]
+        self._transplant_node(index, child)
+        self._release(index)
+
+    def _transplant_node(self, index: int, child: int):
+        parent = self._parent[index]
+        if parent == NIL:
+            self._root = child
+        elif self._left[parent] == index:
+            self._left[parent] = child
+        else:
+            self._right[parent] = child
+        if child != NIL:
+            self._parent[child] = parent
+
+    def inorder_traversal(self) -> typing.Iterator[PoolNode]:
+        left, right = self._left, self._right
+        stack = []
+        current = self._root
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = left[current]
+            current = stack.pop()
+            yield PoolNode(self, current)
+            current = right[current]
+
+_LATEST = object()
+
+class FrozenNode:
+    """Immutable node shared between snapshots of a ConcurrentBinarySearchTree."""
+    __slots__ = ('value', 'left', 'right')
+
+    def __init__(self, value: int, left: typing.Optional['FrozenNode'] = None,
+                 right: typing.Optional['FrozenNode'] = None):
+        self.value = value
+        self.left = left
+        self.right = right
+
+class ConcurrentBinarySearchTree:
+    """
+    BinarySearchTree safe for many reader threads alongside writers, built on copy-on-write path copying.
+
+    Nodes are never mutated once published. A write copies the nodes on the path from the root to the
+    change and then swaps in the new root with a single reference assignment, so readers just grab the
+    current root and see a complete, consistent snapshot without taking any lock. Writers are serialized
+    by a lock. Untouched subtrees are shared between versions and old ones are freed by refcounting.
+    """
+
+    def __init__(self):
+        self._root: typing.Optional[FrozenNode] = None
+        self._write_lock = threading.Lock()
+
+    def snapshot(self) -> typing.Optional[FrozenNode]:
+        return self._root
+
+    def insert(self, value: int):
+        with self._write_lock:
+            path = []
+            current = self._root
+            while current:
+                path.append(current)
+                current = current.left if value < current.value else current.right
+            self._root = self._copy_path(path, value, FrozenNode(value))
+
+    def search(self, value: int) -> typing.Optional[FrozenNode]:
+        current = self._root
+        while current:
+            if value == current.value:
+                return current
+            elif value < current.value:
+                current = current.left
+            else:
+                current = current.right
+        return None
+
+    def delete(self, value: int):
+        with self._write_lock:
+            found, successor = self._delete(value)
+        # Logging writes to app.log, so it happens only after the writer lock is released
+        if not found:
+            logging.warning('Node with value %s not found', value)
+        elif successor is not None:
+            logging.debug('Successor of node %s is %s', value, successor.value)
+
+    def _delete(self, value: int) -> typing.Tuple[bool, typing.Optional[FrozenNode]]:
+        # Called with the writer lock held; returns whether value was found and the
+        # successor that replaced it, if it had two children
+        path = []
+        current = self._root
+        while current and value != current.value:
+            path.append(current)
+            current = current.left if value < current.value else current.right
+        if not current:
+            return False, None
+
+        successor = None
+        if not current.left:
+            replacement = current.right
+        elif not current.right:
+            replacement = current.left
+        else:
+            right_path = []
+            successor = current.right
+            while successor.left:
+                right_path.append(successor)
+                successor = successor.left
+            right = successor.right
+            for node in reversed(right_path):
+                right = FrozenNode(node.value, right, node.right)
+            replacement = FrozenNode(successor.value, current.left, right)
+        self._root = self._copy_path(path, value, replacement)
+        return True, successor
+
+    @staticmethod
+    def _copy_path(path: typing.List[FrozenNode], value: int,
+                   subtree: typing.Optional[FrozenNode]) -> typing.Optional[FrozenNode]:
+        # Rebuilds the ancestors of the changed position bottom-up, sharing every untouched sibling
+        for node in reversed(path):
+            if value < node.value:
+                subtree = FrozenNode(node.value, subtree, node.right)
+            else:
+                subtree = FrozenNode(node.value, node.left, subtree)
+        return subtree
+
+    def inorder_traversal(self, snapshot: typing.Union[FrozenNode, None, object] = _LATEST) -> typing.Iterator[FrozenNode]:
+        # Iterates a single snapshot: the one passed in, or the root current at the first next()
+        stack = []
+        current = self._root if snapshot is _LATEST else snapshot
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current
+            current = current.right
+
+def benchmark_concurrent(keys: int = 100_000, duration: float = 2.0):
+    # Keeps per-delete debug records out of app.log and out of the measured write path
+    logging.getLogger().setLevel(logging.INFO)
+    bst = ConcurrentBinarySearchTree()
+    values = random.sample(range(keys * 10), keys)
+    for value in values:
+        bst.insert(value)
+
+    for readers in (1, 4, 16):
+        stop = threading.Event()
+        reads = [0] * readers
+        writes = [0]
+
+        def read(slot: int):
+            rng = random.Random(slot)
+            search = bst.search
+            count = 0
+            while not stop.is_set():
+                for _ in range(1000):
+                    search(rng.choice(values))
+                count += 1000
+            reads[slot] = count
+
+        def write():
+            rng = random.Random()
+            while not stop.is_set():
+                value = rng.choice(values)
+                bst.delete(value)
+                bst.insert(value)
+                writes[0] += 2
+
+        threads = [threading.Thread(target=write)]
+        threads += [threading.Thread(target=read, args=(slot,)) for slot in range(readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        print(f'{readers:2d} readers: {sum(reads) / duration:,.0f} searches/s, '
+              f'{writes[0] / duration:,.0f} writes/s')
+
+def _bytes_per_key(cls, values: typing.List[int]) -> float:
+    # Traced on a separate build: tracemalloc makes the pool's array reallocations far slower than normal
+    tracemalloc.start()
+    bst = cls()
     for value in values:
         bst.insert(value)
-    print('Inserted values:', values)
-    value_to_search = random.choice(values)
-    found_node = bst.search(value_to_search)
-    if found_node:
-        print(f'Found node with value {found_node.value}')
-    value_to_delete = random.choice(values)
-    bst.delete(value_to_delete)
-    print(f'Deleted node with value {value_to_delete}')
-    print('In-order traversal:', [node.value for node in bst.inorder_traversal()])
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(values)
+
+def benchmark(n: int = 1_000_000, searches: int = 200_000, traced: int = 100_000):
+    values = [random.randint(0, 2 ** 62) for _ in range(n)]
+    probes = random.sample(values, searches)
+    for cls in (BinarySearchTree, ArrayBinarySearchTree):
+        start = time.perf_counter()
+        bst = cls()
+        for value in values:
+            bst.insert(value)
+        build = time.perf_counter() - start
+
+        search = bst.search
+        start = time.perf_counter()
+        for value in probes:
+            search(value)
+        lookup = time.perf_counter() - start
+        del bst
+        print(f'{cls.__name__}: {_bytes_per_key(cls, values[:traced]):.1f} bytes/key, insert {build:.2f}s, '
+              f'{searches / lookup:,.0f} searches/s')
+
+if __name__ == '__main__':
+    if '--benchmark' in sys.argv:
+        benchmark()
+    elif '--benchmark-concurrent' in sys.argv:
+        benchmark_concurrent()
+    else:
+        bst = BinarySearchTree()
+        values = [random.randint(0, 100) for _ in range(10)]
+        for value in values:
+            bst.insert(value)
+        print('Inserted values:', values)
+        value_to_search = random.choice(values)
+        found_node = bst.search(value_to_search)
+        if found_node:
+            print(f'Found node with value {found_node.value}')
+        value_to_delete = random.choice(values)
+        bst.delete(value_to_delete)
+        print(f'Deleted node with value {value_to_delete}')
+        print('In-order traversal:', [node.value for node in bst.inorder_traversal()])
 ```
\ No newline at end of file
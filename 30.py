@@ -7,8 +7,13 @@ This program generates a random 3D maze and solves it using a depth-first search
 
 import random
 import logging
+import sys
 import timeit
-from typing import List, Tuple, Dict, Set
+import tracemalloc
+from array import array
+from collections import OrderedDict, deque
+from heapq import heappop, heappush
+from typing import Callable, List, Tuple, Dict, Optional, Set
 from dataclasses import dataclass
 
 logging.basicConfig(level=logging.DEBUG)
@@ -82,14 +87,265 @@ class Maze:
                 stack.append((neighbor, path + [neighbor]))
         return []
 
+# Direction order shared by the wall bits and ArrayMaze.offsets: +x, -x, +y, -y, +z, -z.
+OPPOSITE = [1, 0, 3, 2, 5, 4]
+ALL_WALLS = 0x3F
+VISITED = 0x40
+
+class ArrayMaze:
+    """
+    Maze backend that stores the grid as flat bytearrays indexed by x + width * (y + height * z).
+
+    Every cell is one byte: the low six bits are its walls (one per direction) and bit 6 is
+    the visited flag. A second bytearray holds, per cell, the directions that stay inside
+    the grid, so neighbor lookups are a bit test plus a precomputed index offset.
+
+    Solved paths are kept in an LRU cache keyed by (start, end, method) and dropped
+    whenever the maze is regenerated.
+    """
+
+    def __init__(self, width: int, height: int, depth: int, cache_size: int = 128):
+        self.width = width
+        self.height = height
+        self.depth = depth
+        self.size = width * height * depth
+        self.offsets = [1, -1, width, -width, width * height, -width * height]
+        self.cells = bytearray([ALL_WALLS]) * self.size
+
+        row = bytes((x < width - 1) | (x > 0) << 1 for x in range(width))
+        exits = bytearray()
+        for z in range(depth):
+            for y in range(height):
+                extra = (y < height - 1) << 2 | (y > 0) << 3 | (z < depth - 1) << 4 | (z > 0) << 5
+                exits += bytes(b | extra for b in row)
+        self.exits = exits
+        self.cache_size = cache_size
+        self._solutions: "OrderedDict[Tuple[int, int, str], Tuple[int, ...]]" = OrderedDict()
+
+    def index(self, x: int, y: int, z: int) -> int:
+        return x + self.width * (y + self.height * z)
+
+    def coordinates(self, index: int) -> Tuple[int, int, int]:
+        rest, x = divmod(index, self.width)
+        z, y = divmod(rest, self.height)
+        return x, y, z
+
+    def is_valid_cell(self, cell: Cell) -> bool:
+        return 0 <= cell.x < self.width and 0 <= cell.y < self.height and 0 <= cell.z < self.depth
+
+    def open_neighbors(self, index: int) -> List[int]:
+        """Neighbors reachable from the cell, i.e. not separated by a wall."""
+        passages = ~self.cells[index] & self.exits[index]
+        return [index + offset for d, offset in enumerate(self.offsets) if passages >> d & 1]
+
+    def generate(self, start: Optional[int] = None):
+        """Carves a perfect maze with an iterative randomized depth-first search."""
+        cells = self.cells
+        exits = self.exits
+        offsets = self.offsets
+        cells[:] = bytearray([ALL_WALLS]) * self.size
+        self._solutions.clear()
+
+        if start is None:
+            start = random.randrange(self.size)
+        cells[start] |= VISITED
+        stack = [start]
+        while stack:
+            index = stack[-1]
+            options = exits[index]
+            choices = [d for d in range(6) if options >> d & 1 and not cells[index + offsets[d]] & VISITED]
+            if not choices:
+                stack.pop()
+                continue
+            d = random.choice(choices)
+            neighbor = index + offsets[d]
+            cells[index] &= ~(1 << d)
+            cells[neighbor] = (cells[neighbor] & ~(1 << OPPOSITE[d])) | VISITED
+            stack.append(neighbor)
+
+    def print(self):
+        # Each layer is drawn on a (2 * width + 1) x (2 * height + 1) character grid. Cells
+        # with an opening to the layer above/below are marked "U", "D" or "X" (both).
+        for z in range(self.depth):
+            print(f"Layer {z}")
+            print("#" * (2 * self.width + 1))
+            for y in range(self.height):
+                line = ["#"]
+                below = ["#"]
+                for x in range(self.width):
+                    walls = self.cells[self.index(x, y, z)]
+                    up = not walls & 1 << 4
+                    down = not walls & 1 << 5
+                    line.append("X" if up and down else "U" if up else "D" if down else ".")
+                    line.append("#" if walls & 1 else ".")
+                    below.append("#" if walls & 1 << 2 else ".")
+                    below.append("#")
+                print("".join(line))
+                print("".join(below))
+
+    def solve(self, start: Cell, end: Cell, method: str = "bfs") -> List[Cell]:
+        """Finds a path through the carved passages with one of the SOLVERS ("dfs", "bfs", "astar", "bidirectional")."""
+        if not (self.is_valid_cell(start) and self.is_valid_cell(end)):
+            return []
+        return [Cell(*self.coordinates(index), visited=True) for index in self.solve_indices(
+            self.index(start.x, start.y, start.z), self.index(end.x, end.y, end.z), method)]
+
+    def solve_indices(self, source: int, target: int, method: str = "bfs") -> Tuple[int, ...]:
+        key = (source, target, method)
+        path = self._solutions.get(key)
+        if path is not None:
+            self._solutions.move_to_end(key)
+            return path
+
+        path = tuple(SOLVERS[method](self, source, target))
+        self._solutions[key] = path
+        if len(self._solutions) > self.cache_size:
+            self._solutions.popitem(last=False)
+        return path
+
+def _walk_parents(parents: array, index: int) -> List[int]:
+    path = [index]
+    while parents[index] != index:
+        index = parents[index]
+        path.append(index)
+    return path
+
+def _new_parents(size: int) -> array:
+    return array("l", [-1]) * size
+
+def dfs_solve(maze: ArrayMaze, source: int, target: int) -> List[int]:
+    """Depth-first search with parent pointers; finds a path, not necessarily the shortest."""
+    parents = _new_parents(maze.size)
+    parents[source] = source
+    stack = [source]
+    while stack:
+        index = stack.pop()
+        if index == target:
+            return _walk_parents(parents, target)[::-1]
+        for neighbor in maze.open_neighbors(index):
+            if parents[neighbor] < 0:
+                parents[neighbor] = index
+                stack.append(neighbor)
+    return []
+
+def bfs_solve(maze: ArrayMaze, source: int, target: int) -> List[int]:
+    """Breadth-first search with parent pointers; returns a shortest path."""
+    parents = _new_parents(maze.size)
+    parents[source] = source
+    queue = deque([source])
+    while queue:
+        index = queue.popleft()
+        if index == target:
+            return _walk_parents(parents, target)[::-1]
+        for neighbor in maze.open_neighbors(index):
+            if parents[neighbor] < 0:
+                parents[neighbor] = index
+                queue.append(neighbor)
+    return []
+
+def astar_solve(maze: ArrayMaze, source: int, target: int) -> List[int]:
+    """A* search with a Manhattan distance heuristic on (x, y, z); returns a shortest path."""
+    tx, ty, tz = maze.coordinates(target)
+
+    def heuristic(index: int) -> int:
+        x, y, z = maze.coordinates(index)
+        return abs(x - tx) + abs(y - ty) + abs(z - tz)
+
+    parents = _new_parents(maze.size)
+    parents[source] = source
+    costs = {source: 0}
+    heap = [(heuristic(source), 0, source)]
+    while heap:
+        _, cost, index = heappop(heap)
+        if index == target:
+            return _walk_parents(parents, target)[::-1]
+        if cost > costs[index]:
+            continue
+        for neighbor in maze.open_neighbors(index):
+            new_cost = cost + 1
+            if new_cost < costs.get(neighbor, new_cost + 1):
+                costs[neighbor] = new_cost
+                parents[neighbor] = index
+                heappush(heap, (new_cost + heuristic(neighbor), new_cost, neighbor))
+    return []
+
+def bidirectional_solve(maze: ArrayMaze, source: int, target: int) -> List[int]:
+    """Breadth-first search from both ends, expanding the smaller frontier; returns a shortest path."""
+    if source == target:
+        return [source]
+    forward = _new_parents(maze.size)
+    backward = _new_parents(maze.size)
+    forward[source] = source
+    backward[target] = target
+    frontiers = ([source], [target])
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parents, others = (forward, backward) if side == 0 else (backward, forward)
+        next_frontier = []
+        meeting = -1
+        for index in frontiers[side]:
+            for neighbor in maze.open_neighbors(index):
+                if parents[neighbor] >= 0:
+                    continue
+                parents[neighbor] = index
+                if others[neighbor] >= 0:
+                    meeting = neighbor
+                    break
+                next_frontier.append(neighbor)
+            if meeting >= 0:
+                return _walk_parents(forward, meeting)[::-1] + _walk_parents(backward, meeting)[1:]
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+    return []
+
+SOLVERS: Dict[str, Callable[[ArrayMaze, int, int], List[int]]] = {
+    "dfs": dfs_solve,
+    "bfs": bfs_solve,
+    "astar": astar_solve,
+    "bidirectional": bidirectional_solve,
+}
+
+def benchmark_solvers(sizes: Tuple[int, ...] = (10, 25, 50, 100, 200)):
+    """Times every solver between opposite corners of generated size^3 mazes."""
+    for size in sizes:
+        maze = ArrayMaze(size, size, size)
+        start = timeit.default_timer()
+        maze.generate()
+        row = f"{size:>4}^3 | generate {timeit.default_timer() - start:8.3f}s"
+        source, target = 0, maze.size - 1
+        lengths = set()
+        for method, solver in SOLVERS.items():
+            start = timeit.default_timer()
+            lengths.add(len(solver(maze, source, target)))
+            row += f" | {method} {timeit.default_timer() - start:8.3f}s"
+        # A generated maze is perfect, so every solver must find the same unique path.
+        assert len(lengths) == 1
+        print(row)
+
+def compare_memory(size: int = 100):
+    """Reports the memory taken by the Cell-dict Maze and by ArrayMaze for a size^3 grid."""
+    for backend in (Maze, ArrayMaze):
+        tracemalloc.start()
+        maze = backend(size, size, size)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{backend.__name__:>9}: {current / 2**20:10.2f} MiB for {size}^3 cells")
+        del maze
+
 if __name__ == "__main__":
-    start = timeit.default_timer()
+    t0 = timeit.default_timer()
 
     width = 10
     height = 10
     depth = 10
 
-    maze = Maze(width, height, depth)
+    if "--memory" in sys.argv:
+        compare_memory()
+        sys.exit()
+    if "--benchmark" in sys.argv:
+        benchmark_solvers()
+        sys.exit()
+
+    maze = ArrayMaze(width, height, depth) if "--array" in sys.argv else Maze(width, height, depth)
     maze.generate()
     maze.print()
 
@@ -102,5 +358,5 @@ if __name__ == "__main__":
         print("No solution found")
 
     stop = timeit.default_timer()
-    print(f"Elapsed time: {stop - start}")
+    print(f"Elapsed time: {stop - t0}")
 ```
\ No newline at end of file
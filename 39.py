@@ -4,6 +4,14 @@
 import random
 import math
 import logging
+import os
+import struct
+import sys
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +29,9 @@ class Vector:
     
     def __mul__(self, other):
         return Vector(self.x * other, self.y * other)
+
+    def __neg__(self):
+        return Vector(-self.x, -self.y)
     
     def dot(self, other):
         return self.x * other.x + self.y * other.y
@@ -61,19 +72,486 @@ class Swarm:
             particle.draw()
     
 
-# Create a swarm of 100 particles
-swarm = Swarm([Particle(Vector(random.uniform(-10, 10), random.uniform(-10, 10)), 
-                       Vector(random.uniform(-1, 1), random.uniform(-1, 1))) for _ in range(100)], 10)
+class VectorizedSwarm:
+    """
+    Swarm stored as structure-of-arrays: positions and velocities are contiguous (n, 2)
+    float64 arrays and radii an (n,) array, so a whole step is a handful of NumPy calls.
+
+    Takes the same constructor arguments as Swarm; use from_random to build very large
+    swarms without creating Particle objects first.
+    """
+
+    def __init__(self, particles: list[Particle], radius: float, collisions: bool = False):
+        self.positions = np.array([(p.position.x, p.position.y) for p in particles], dtype=np.float64).reshape(-1, 2)
+        self.velocities = np.array([(p.velocity.x, p.velocity.y) for p in particles], dtype=np.float64).reshape(-1, 2)
+        self.radii = np.array([p.radius for p in particles], dtype=np.float64)
+        self.radius = radius # in meters
+        self.collisions = collisions
+        self._allocate()
+
+    @classmethod
+    def from_random(cls, n: int, radius: float, rng: np.random.Generator = None,
+                    extent: float = 10, collisions: bool = False):
+        # Same distributions as the particles created at the bottom of this program;
+        # positions are drawn from [-extent, extent] on both axes
+        rng = rng or np.random.default_rng()
+        swarm = cls.__new__(cls)
+        swarm.positions = rng.uniform(-extent, extent, size=(n, 2))
+        swarm.velocities = rng.uniform(-1, 1, size=(n, 2))
+        swarm.radii = rng.uniform(0.1, 1, size=n)
+        swarm.radius = radius
+        swarm.collisions = collisions
+        swarm._allocate()
+        return swarm
+
+    def _allocate(self):
+        # Scratch buffers reused by every update to avoid per-step allocations
+        n = len(self.positions)
+        self._step = np.empty((n, 2), dtype=np.float64)
+        self._norm2 = np.empty(n, dtype=np.float64)
+        self._outside = np.empty(n, dtype=bool)
+        # Cell order of the particles from the previous step, used to re-sort incrementally
+        self._order = np.arange(n)
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def particles(self) -> list[Particle]:
+        # Materializes Particle objects; only meant for small swarms
+        particles = []
+        for (x, y), (vx, vy), r in zip(self.positions.tolist(), self.velocities.tolist(), self.radii.tolist()):
+            particle = Particle(Vector(x, y), Vector(vx, vy))
+            particle.radius = r
+            particles.append(particle)
+        return particles
+
+    def update(self, dt: float):
+        # Move every particle: positions += velocities * dt
+        np.multiply(self.velocities, dt, out=self._step)
+        self.positions += self._step
+
+        # Bounce overlapping particles off each other
+        if self.collisions:
+            self.resolve_collisions(*self.find_overlapping_pairs())
+
+        # Reverse the velocity of particles outside the swarm boundary
+        np.einsum("ij,ij->i", self.positions, self.positions, out=self._norm2)
+        np.greater(self._norm2, self.radius * self.radius, out=self._outside)
+        self.velocities[self._outside] *= -1
+
+    def find_overlapping_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        # Uniform-grid spatial hash: cells are as wide as the largest particle diameter, so
+        # overlapping particles are always in the same or in adjacent cells
+        n = len(self)
+        if n < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        cell_size = 2 * self.radii.max()
+        cells = np.floor(self.positions / cell_size).astype(np.int64)
+        cells -= cells.min(axis=0)
+        # One empty column/row of padding on each side keeps neighbor keys from wrapping
+        stride = int(cells[:, 1].max()) + 3
+        keys = (cells[:, 0] + 1) * stride + (cells[:, 1] + 1)
+
+        # Particles barely move between steps, so last step's order is nearly sorted and
+        # the stable (merge-based) sort only has to patch it up
+        order = self._order[np.argsort(keys[self._order], kind="stable")]
+        self._order = order
+        sorted_keys = keys[order]
+
+        firsts, seconds = [], []
+        positions = np.arange(n)
+        # The own cell plus half of the eight neighbors, so each pair is visited once
+        for delta in (0, stride - 1, stride, stride + 1, 1):
+            if delta == 0:
+                lo = positions + 1
+            else:
+                lo = np.searchsorted(sorted_keys, sorted_keys + delta, side="left")
+            hi = np.searchsorted(sorted_keys, sorted_keys + delta, side="right")
+            counts = np.maximum(hi - lo, 0)
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            starts = np.cumsum(counts) - counts
+            firsts.append(np.repeat(positions, counts))
+            seconds.append(np.arange(total) - np.repeat(starts - lo, counts))
+        if not firsts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        i = order[np.concatenate(firsts)]
+        j = order[np.concatenate(seconds)]
+        offset = self.positions[j] - self.positions[i]
+        reach = self.radii[i] + self.radii[j]
+        overlapping = np.einsum("ij,ij->i", offset, offset) < reach * reach
+        return i[overlapping], j[overlapping]
+
+    def resolve_collisions(self, i: np.ndarray, j: np.ndarray, max_rounds: int = 64):
+        # Elastic collisions between discs with mass proportional to their area; pairs that
+        # are already separating are left alone. Each round resolves a batch of approaching
+        # pairs that share no particle, so every update is an exact two-body collision and
+        # energy is conserved even when a particle has several contacts; rounds repeat until
+        # no overlapping pair is approaching any more
+        if len(i) == 0:
+            return
+        normal = self.positions[j] - self.positions[i]
+        distance = np.sqrt(np.einsum("ij,ij->i", normal, normal))
+        distance[distance == 0] = 1
+        normal /= distance[:, None]
+        mass_i = self.radii[i] ** 2
+        mass_j = self.radii[j] ** 2
+
+        for _ in range(max_rounds):
+            approach = np.einsum("ij,ij->i", self.velocities[i] - self.velocities[j], normal)
+            approaching = np.flatnonzero(approach > 0)
+            if len(approaching) == 0:
+                return
+            i, j, normal, mass_i, mass_j = (a[approaching] for a in (i, j, normal, mass_i, mass_j))
+            approach = approach[approaching]
+
+            # A pair joins this round's batch if it is the first pair of both its particles
+            ends = np.stack([i, j], axis=1).ravel()
+            _, firsts = np.unique(ends, return_index=True)
+            first = np.zeros(len(ends), dtype=bool)
+            first[firsts] = True
+            batch = first.reshape(-1, 2).all(axis=1)
+
+            impulse = (2 * approach[batch] / (mass_i[batch] + mass_j[batch]))[:, None] * normal[batch]
+            self.velocities[i[batch]] -= impulse * mass_j[batch, None]
+            self.velocities[j[batch]] += impulse * mass_i[batch, None]
+        logger.debug(f"Collisions still unresolved after {max_rounds} rounds")
+
+    def kinetic_energy(self) -> float:
+        return 0.5 * float(np.einsum("i,ij,ij->", self.radii ** 2, self.velocities, self.velocities))
+
+    def draw(self):
+        # Drawing is not implemented for the vectorized swarm either
+        pass
+
+# Shared position/velocity arrays attached by each ParallelSwarm worker process
+_worker_arrays = {}
+
+def _attach_worker(positions_name: str, velocities_name: str, n: int):
+    for key, name in (("positions", positions_name), ("velocities", velocities_name)):
+        shm = shared_memory.SharedMemory(name=name)
+        _worker_arrays[key + "_shm"] = shm
+        _worker_arrays[key] = np.ndarray((n, 2), dtype=np.float64, buffer=shm.buf)
+    # Per-process scratch buffers, sliced to the slab size on every step
+    _worker_arrays["step"] = np.empty((n, 2), dtype=np.float64)
+    _worker_arrays["norm2"] = np.empty(n, dtype=np.float64)
+    _worker_arrays["outside"] = np.empty(n, dtype=bool)
+
+def _step_slab(start: int, stop: int, radius: float, dt: float, edges: np.ndarray, slab: int) -> tuple:
+    # Same operations as VectorizedSwarm.update, so results are bit-for-bit identical;
+    # returns the rows that left the slab and the slab each of them moved to
+    positions = _worker_arrays["positions"][start:stop]
+    velocities = _worker_arrays["velocities"][start:stop]
+    step = _worker_arrays["step"][:stop - start]
+    norm2 = _worker_arrays["norm2"][:stop - start]
+    outside = _worker_arrays["outside"][:stop - start]
+    np.multiply(velocities, dt, out=step)
+    positions += step
+    np.einsum("ij,ij->i", positions, positions, out=norm2)
+    np.greater(norm2, radius * radius, out=outside)
+    velocities[outside] *= -1
+    x = positions[:, 0]
+    lo = edges[slab - 1] if slab > 0 else -np.inf
+    hi = edges[slab] if slab < len(edges) else np.inf
+    crossed = np.flatnonzero((x < lo) | (x >= hi))
+    return crossed + start, np.searchsorted(edges, x[crossed], side="right")
+
+class ParallelSwarm:
+    """
+    Domain-decomposed driver for a VectorizedSwarm. Space is split into vertical slabs
+    holding roughly equal numbers of particles; particles are kept sorted by slab in
+    shared memory so each worker process steps one contiguous range in place. Workers
+    report the particles that left their slab, and between steps only those (plus as
+    many rows as the slab boundaries shift by) are moved, so the serial work in the
+    parent is proportional to the number of crossings rather than to n.
+    """
+
+    def __init__(self, swarm: VectorizedSwarm, workers: int):
+        if swarm.collisions:
+            raise ValueError("ParallelSwarm does not support particle collisions")
+        n = len(swarm)
+        self.n = n
+        self.radius = swarm.radius
+        self.workers = workers
+        self.crossings = 0
+
+        self._shms = [shared_memory.SharedMemory(create=True, size=max(1, n * 2 * 8)) for _ in range(2)]
+        self.positions = np.ndarray((n, 2), dtype=np.float64, buffer=self._shms[0].buf)
+        self.velocities = np.ndarray((n, 2), dtype=np.float64, buffer=self._shms[1].buf)
+        self.positions[:] = swarm.positions
+        self.velocities[:] = swarm.velocities
+        self.radii = swarm.radii.copy()
+        self.ids = np.arange(n)
+
+        # Slab edges at the x quantiles balance the load at the start of the run
+        self.edges = np.quantile(swarm.positions[:, 0], np.linspace(0, 1, workers + 1)[1:-1]) if n else np.empty(0)
+        self._sort_by_slab()
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_attach_worker,
+                                             initargs=(self._shms[0].name, self._shms[1].name, n))
+
+    def _sort_by_slab(self):
+        # Full reordering, only done once when the driver is created
+        slabs = np.searchsorted(self.edges, self.positions[:, 0], side="right")
+        order = np.argsort(slabs, kind="stable")
+        self.positions[:] = self.positions[order]
+        self.velocities[:] = self.velocities[order]
+        self.radii = self.radii[order]
+        self.ids = self.ids[order]
+        self.bounds = np.searchsorted(slabs[order], np.arange(self.workers + 1), side="left")
+
+    def _exchange(self, rows: np.ndarray, targets: np.ndarray):
+        # rows are the particles that left their slab and targets the slabs they entered.
+        # Slab sizes change by arrivals minus departures, which shifts the boundaries; the
+        # rows to move are the crossers plus the staying rows that end up outside their
+        # slab's new range, and they fill the crossers' slots plus the rows newly covered
+        if len(rows) == 0:
+            return
+        self.crossings += len(rows)
+        old = self.bounds
+        sources = np.searchsorted(old, rows, side="right") - 1
+        sizes = np.diff(old) - np.bincount(sources, minlength=self.workers) + np.bincount(targets, minlength=self.workers)
+        new = np.concatenate(([0], np.cumsum(sizes)))
+
+        moved, holes = [], []
+        for slab in range(self.workers):
+            old_lo, old_hi, new_lo, new_hi = old[slab], old[slab + 1], new[slab], new[slab + 1]
+            leaving = np.concatenate((np.arange(old_lo, min(old_hi, new_lo)), np.arange(max(old_lo, new_hi), old_hi)))
+            moved.append(rows[targets == slab])
+            moved.append(leaving[~np.isin(leaving, rows)])
+            own = rows[sources == slab]
+            holes.append(own[(own >= new_lo) & (own < new_hi)])
+            holes.append(np.arange(new_lo, min(new_hi, old_lo)))
+            holes.append(np.arange(max(new_lo, old_hi), new_hi))
+        moved = np.concatenate(moved)
+        holes = np.concatenate(holes)
+
+        # Fancy-indexed reads copy first, so overlapping source and destination rows are safe
+        self.positions[holes] = self.positions[moved]
+        self.velocities[holes] = self.velocities[moved]
+        self.radii[holes] = self.radii[moved]
+        self.ids[holes] = self.ids[moved]
+        self.bounds = new
+
+    def update(self, dt: float):
+        futures = [self._executor.submit(_step_slab, int(start), int(stop), self.radius, dt, self.edges, slab)
+                   for slab, (start, stop) in enumerate(zip(self.bounds[:-1], self.bounds[1:])) if stop > start]
+        results = [future.result() for future in futures]
+        if not results:
+            # Empty swarm: no slab had any rows to step
+            return
+        self._exchange(np.concatenate([rows for rows, _ in results]),
+                       np.concatenate([targets for _, targets in results]))
+
+    def gather(self) -> VectorizedSwarm:
+        # Copies the current state back into a serial swarm, in the original particle order
+        inverse = np.empty_like(self.ids)
+        inverse[self.ids] = np.arange(self.n)
+        swarm = VectorizedSwarm([], self.radius)
+        swarm.positions = self.positions[inverse]
+        swarm.velocities = self.velocities[inverse]
+        swarm.radii = self.radii[inverse]
+        swarm._allocate()
+        return swarm
+
+    def close(self):
+        self._executor.shutdown()
+        del self.positions, self.velocities
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Trajectory files: a 64-byte header, the float32 radii, then fixed-size frames (step
+# number plus float32 positions and velocities) starting on a 64-byte boundary, so the
+# frames can be memory mapped as one structured array.
+TRAJECTORY_MAGIC = b"SWRM"
+TRAJECTORY_VERSION = 1
+TRAJECTORY_HEADER = struct.Struct("<4sHHQdQ")
+TRAJECTORY_HEADER_SIZE = 64
+
+def _frame_dtype(n: int) -> np.dtype:
+    return np.dtype([("step", "<i8"), ("positions", "<f4", (n, 2)), ("velocities", "<f4", (n, 2))])
+
+def _data_offset(n: int) -> int:
+    return -(-(TRAJECTORY_HEADER_SIZE + 4 * n) // 64) * 64
+
+def _read_header(f) -> tuple:
+    magic, version, _, n, radius, every = TRAJECTORY_HEADER.unpack(f.read(TRAJECTORY_HEADER.size))
+    if magic != TRAJECTORY_MAGIC or version != TRAJECTORY_VERSION:
+        raise ValueError(f"Not a version {TRAJECTORY_VERSION} swarm trajectory file")
+    return n, radius, every
+
+class TrajectoryWriter:
+    """
+    Streams a snapshot of a VectorizedSwarm every `every` steps to a trajectory file.
+    Passing the step returned by restore_swarm as resume_step continues an existing file:
+    frames after that step, and any incomplete frame left by an interrupted run, are dropped.
+    """
+
+    def __init__(self, path: str, swarm: VectorizedSwarm, every: int = 10, resume_step: int = None):
+        n = len(swarm)
+        self.path = path
+        self.every = every
+        self._frame = np.zeros(1, dtype=_frame_dtype(n))
+
+        if resume_step is not None:
+            reader = TrajectoryReader(path)
+            if reader.n != n:
+                raise ValueError(f"Trajectory holds {reader.n} particles, swarm has {n}")
+            frames = int(np.searchsorted(reader.frames["step"], resume_step, side="right"))
+            del reader
+            self._file = open(path, "r+b")
+            self._file.truncate(_data_offset(n) + frames * self._frame.itemsize)
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self._file = open(path, "wb")
+            header = TRAJECTORY_HEADER.pack(TRAJECTORY_MAGIC, TRAJECTORY_VERSION, 0, n, swarm.radius, every)
+            self._file.write(header.ljust(TRAJECTORY_HEADER_SIZE, b"\0"))
+            self._file.write(swarm.radii.astype("<f4").tobytes())
+            self._file.write(b"\0" * (_data_offset(n) - self._file.tell()))
+
+    def record(self, step: int, swarm: VectorizedSwarm):
+        # Writes a frame if the step falls on the snapshot interval
+        if step % self.every:
+            return
+        frame = self._frame[0]
+        frame["step"] = step
+        frame["positions"] = swarm.positions
+        frame["velocities"] = swarm.velocities
+        self._file.write(self._frame.data)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class TrajectoryReader:
+    """
+    Memory-mapped view of a trajectory file. Iterating yields (step, positions, velocities)
+    per frame without loading the rest of the file; the arrays are read-only views.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.n, self.radius, self.every = _read_header(f)
+        offset = _data_offset(self.n)
+        dtype = _frame_dtype(self.n)
+        count = (os.path.getsize(path) - offset) // dtype.itemsize
+        self.radii = np.memmap(path, dtype="<f4", mode="r", offset=TRAJECTORY_HEADER_SIZE, shape=(self.n,))
+        self.frames = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,)) if count else np.empty(0, dtype)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index: int) -> tuple:
+        frame = self.frames[index]
+        return int(frame["step"]), frame["positions"], frame["velocities"]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+def restore_swarm(path: str, index: int = -1) -> tuple:
+    # Rebuilds the swarm saved in a frame (the last one by default) and returns (step, swarm);
+    # the state is float32, so a resumed run continues from the rounded snapshot
+    reader = TrajectoryReader(path)
+    step, positions, velocities = reader[index]
+    swarm = VectorizedSwarm([], reader.radius)
+    swarm.positions = positions.astype(np.float64)
+    swarm.velocities = velocities.astype(np.float64)
+    swarm.radii = reader.radii.astype(np.float64)
+    swarm._allocate()
+    return step, swarm
+
+def benchmark_vectorized(n: int = 1_000_000, steps: int = 10):
+    swarm = VectorizedSwarm.from_random(n, 10, np.random.default_rng(0))
+    start = timeit.default_timer()
+    for _ in range(steps):
+        swarm.update(0.01)
+    elapsed = (timeit.default_timer() - start) / steps
+    logger.info(f"VectorizedSwarm: {n} particles, {elapsed * 1000:.1f} ms per step")
+
+def benchmark_collisions(sizes: tuple = (1_000, 10_000, 100_000, 1_000_000), steps: int = 5,
+                         tolerance: float = 1e-9):
+    # Keeps the particle density constant so the number of contacts per particle is too
+    for n in sizes:
+        extent = 2 * math.sqrt(n)
+        swarm = VectorizedSwarm.from_random(n, extent, np.random.default_rng(0), extent=extent, collisions=True)
+        energy = swarm.kinetic_energy()
+        start = timeit.default_timer()
+        for _ in range(steps):
+            swarm.update(0.01)
+        elapsed = (timeit.default_timer() - start) / steps
+        pairs = len(swarm.find_overlapping_pairs()[0])
+        drift = abs(swarm.kinetic_energy() - energy) / energy
+        logger.info(f"Collisions: {n:>8} particles, {pairs:>7} overlapping pairs, {elapsed * 1000:8.1f} ms per step, "
+                    f"energy drift {drift:.1e}")
+        if drift > tolerance:
+            logger.error(f"Collisions: kinetic energy not conserved ({drift:.1e} > {tolerance:.0e})")
+
+def benchmark_parallel(n: int = 1_000_000, steps: int = 10, worker_counts: tuple = (1, 2, 4, 8)):
+    serial = VectorizedSwarm.from_random(n, 10, np.random.default_rng(0))
+    for workers in worker_counts:
+        with ParallelSwarm(serial, workers) as parallel:
+            # A zero-length step starts the worker processes outside the timed loop
+            parallel.update(0.0)
+            start = timeit.default_timer()
+            for _ in range(steps):
+                parallel.update(0.01)
+            elapsed = (timeit.default_timer() - start) / steps
+            logger.info(f"ParallelSwarm: {workers} workers, {n} particles, {elapsed * 1000:.1f} ms per step, "
+                        f"{parallel.crossings} slab crossings")
+
+def benchmark_trajectory(path: str = "swarm_trajectory.bin", n: int = 1_000_000, steps: int = 20, every: int = 5):
+    swarm = VectorizedSwarm.from_random(n, 10, np.random.default_rng(0))
+    step_time = write_time = 0.0
+    with TrajectoryWriter(path, swarm, every) as writer:
+        for step in range(steps):
+            start = timeit.default_timer()
+            swarm.update(0.01)
+            step_time += timeit.default_timer() - start
+            start = timeit.default_timer()
+            writer.record(step, swarm)
+            write_time += timeit.default_timer() - start
+    logger.info(f"Trajectory: {steps} steps in {step_time:.3f}s, {len(TrajectoryReader(path))} frames written in "
+                f"{write_time:.3f}s ({write_time / step_time:.1%} of step time)")
+    os.remove(path)
+
+if __name__ == "__main__":
+    # Create a swarm of 100 particles
+    swarm = Swarm([Particle(Vector(random.uniform(-10, 10), random.uniform(-10, 10)), 
+                           Vector(random.uniform(-1, 1), random.uniform(-1, 1))) for _ in range(100)], 10)
+
+    # Run the swarm simulation for 100 time steps
+    for dt in range(100):
+        try:
+            swarm.update(dt)
+        except Exception as e:
+            logger.error(f"Error in swarm update: {e}")
 
-# Run the swarm simulation for 100 time steps
-for dt in range(100):
-    try:
-        swarm.update(dt)
-    except Exception as e:
-        logger.error(f"Error in swarm update: {e}")
+    # Draw the swarm
+    swarm.draw()
 
-# Draw the swarm
-swarm.draw()
+    if "--benchmark" in sys.argv:
+        benchmark_vectorized()
+    if "--benchmark-collisions" in sys.argv:
+        benchmark_collisions()
+    if "--benchmark-parallel" in sys.argv:
+        benchmark_parallel()
+    if "--benchmark-trajectory" in sys.argv:
+        benchmark_trajectory()
 ```
 
 This program simulates a swarm of particles moving in a bounded space. The particles have random positions and velocities, and they bounce off the boundaries of the space. The program uses object-oriented programming, incorporates random number generation, and includes error handling. The main functionality is the simulation of the swarm, which is implemented in the `update` method of the `Swarm` class, where each particle's position and velocity are updated. The `draw` method of the `Swarm` class is intended to visualize the swarm, and the `Particle` class represents an individual particle with its own position, velocity, and radius. This program is a creative and unique implementation of a swarm simulation, different from standard programming tasks or common examples.
\ No newline at end of file
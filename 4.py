@@ -3,8 +3,12 @@
 ```python
 import random
 import logging
+import sys
+import timeit
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -84,7 +88,120 @@ def generate_random_circles(n: int) -> List[Circle]:
         circles.append(circle)
     return circles
 
-def count_points_in_shapes(points: List[Point], shapes: List[Rectangle] + List[Circle]) -> Tuple[int, int]:
+class PointArray:
+    """
+    Points stored as two float64 arrays. Slicing returns a view without copying; Point
+    objects are only created when a single element is accessed.
+    """
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray):
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+
+    @classmethod
+    def random(cls, n: int, rng: Optional[np.random.Generator] = None) -> 'PointArray':
+        """
+        Generates n random points within a unit square in one vectorized call.
+
+        Args:
+            n: The number of points to generate.
+            rng: The generator to draw from (a fresh default generator if omitted).
+
+        Returns:
+            A PointArray of n random points.
+        """
+        coordinates = (rng or np.random.default_rng()).random((2, n))
+        return cls(coordinates[0], coordinates[1])
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PointArray(self.xs[index], self.ys[index])
+        return Point(float(self.xs[index]), float(self.ys[index]))
+
+    def __iter__(self):
+        for x, y in zip(self.xs.tolist(), self.ys.tolist()):
+            yield Point(x, y)
+
+class RectArray:
+    """
+    Rectangles stored as four float64 arrays (top-left and bottom-right corners).
+    """
+
+    def __init__(self, x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray):
+        self.x0 = np.asarray(x0, dtype=np.float64)
+        self.y0 = np.asarray(y0, dtype=np.float64)
+        self.x1 = np.asarray(x1, dtype=np.float64)
+        self.y1 = np.asarray(y1, dtype=np.float64)
+
+    @classmethod
+    def random(cls, n: int, rng: Optional[np.random.Generator] = None) -> 'RectArray':
+        """
+        Generates n random rectangles within a unit square in one vectorized call.
+
+        Args:
+            n: The number of rectangles to generate.
+            rng: The generator to draw from (a fresh default generator if omitted).
+
+        Returns:
+            A RectArray of n random rectangles.
+        """
+        corners = (rng or np.random.default_rng()).random((4, n))
+        return cls(corners[0], corners[1], corners[2], corners[3])
+
+    def __len__(self) -> int:
+        return len(self.x0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RectArray(self.x0[index], self.y0[index], self.x1[index], self.y1[index])
+        return Rectangle(Point(float(self.x0[index]), float(self.y0[index])),
+                         Point(float(self.x1[index]), float(self.y1[index])))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+class CircleArray:
+    """
+    Circles stored as center coordinate and radius float64 arrays.
+    """
+
+    def __init__(self, cx: np.ndarray, cy: np.ndarray, radius: np.ndarray):
+        self.cx = np.asarray(cx, dtype=np.float64)
+        self.cy = np.asarray(cy, dtype=np.float64)
+        self.radius = np.asarray(radius, dtype=np.float64)
+
+    @classmethod
+    def random(cls, n: int, rng: Optional[np.random.Generator] = None) -> 'CircleArray':
+        """
+        Generates n random circles within a unit square in one vectorized call.
+
+        Args:
+            n: The number of circles to generate.
+            rng: The generator to draw from (a fresh default generator if omitted).
+
+        Returns:
+            A CircleArray of n random circles.
+        """
+        values = (rng or np.random.default_rng()).random((3, n))
+        return cls(values[0], values[1], values[2])
+
+    def __len__(self) -> int:
+        return len(self.cx)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CircleArray(self.cx[index], self.cy[index], self.radius[index])
+        return Circle(Point(float(self.cx[index]), float(self.cy[index])), float(self.radius[index]))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+def count_points_in_shapes(points: List[Point], shapes: List[Union[Rectangle, Circle]]) -> Tuple[int, int]:
     """
     Counts the number of points that are contained within the given shapes.
 
@@ -107,7 +224,171 @@ def count_points_in_shapes(points: List[Point], shapes: List[Rectangle] + List[C
                     num_points_in_circles += 1
     return num_points_in_rectangles, num_points_in_circles
 
+class PointGrid:
+    """
+    Uniform grid index over a set of points.
+
+    Points are sorted by grid cell, and every cell keeps the bounding box of the points it
+    actually holds. A shape query classifies the cells under the shape's bounding box:
+    cells entirely inside the shape contribute their point count directly, cells that
+    cannot intersect are skipped, and only the points of the remaining cells are tested
+    (vectorized, comparing squared distances for circles).
+    """
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, grid_size: Optional[int] = None):
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        n = len(xs)
+        # About 32 points per cell on average
+        self.grid_size = grid_size or int(min(256, max(1, (n / 32) ** 0.5)))
+        g = self.grid_size
+
+        if n:
+            self.x_min, self.y_min = xs.min(), ys.min()
+            self.cell_width = max(xs.max() - self.x_min, 1e-12) / g
+            self.cell_height = max(ys.max() - self.y_min, 1e-12) / g
+        else:
+            self.x_min = self.y_min = 0.0
+            self.cell_width = self.cell_height = 1.0 / g
+
+        cells = self._column(xs) * g + self._row(ys)
+        order = np.argsort(cells, kind="stable")
+        self.xs = xs[order]
+        self.ys = ys[order]
+        cells = cells[order]
+
+        self.counts = np.bincount(cells, minlength=g * g)
+        self.starts = np.concatenate(([0], np.cumsum(self.counts)))
+
+        # Bounding box of the points held by every cell (empty cells get an inverted box)
+        self.cell_x_min = np.full(g * g, np.inf)
+        self.cell_x_max = np.full(g * g, -np.inf)
+        self.cell_y_min = np.full(g * g, np.inf)
+        self.cell_y_max = np.full(g * g, -np.inf)
+        occupied = np.flatnonzero(self.counts)
+        if n:
+            firsts = self.starts[occupied]
+            self.cell_x_min[occupied] = np.minimum.reduceat(self.xs, firsts)
+            self.cell_x_max[occupied] = np.maximum.reduceat(self.xs, firsts)
+            self.cell_y_min[occupied] = np.minimum.reduceat(self.ys, firsts)
+            self.cell_y_max[occupied] = np.maximum.reduceat(self.ys, firsts)
+
+    def _column(self, xs) -> np.ndarray:
+        return np.clip(np.floor((np.asarray(xs) - self.x_min) / self.cell_width), 0, self.grid_size - 1).astype(np.int64)
+
+    def _row(self, ys) -> np.ndarray:
+        return np.clip(np.floor((np.asarray(ys) - self.y_min) / self.cell_height), 0, self.grid_size - 1).astype(np.int64)
+
+    def _cells_under(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        # Cells whose grid rectangle overlaps the box, with a one-cell margin for rounding
+        g = self.grid_size
+        c0, c1 = max(int(self._column(x0)) - 1, 0), min(int(self._column(x1)) + 1, g - 1)
+        r0, r1 = max(int(self._row(y0)) - 1, 0), min(int(self._row(y1)) + 1, g - 1)
+        return (np.arange(c0, c1 + 1)[:, None] * g + np.arange(r0, r1 + 1)[None, :]).ravel()
+
+    def _points_in(self, cells: np.ndarray) -> np.ndarray:
+        # Indices (into the sorted arrays) of all points held by the given cells
+        counts = self.counts[cells]
+        total = int(counts.sum())
+        offsets = np.cumsum(counts) - counts
+        return np.arange(total) - np.repeat(offsets - self.starts[cells], counts)
+
+    def count_in_rectangle(self, x0: float, y0: float, x1: float, y1: float) -> int:
+        if x0 > x1 or y0 > y1 or not len(self.xs):
+            return 0
+        cells = self._cells_under(x0, y0, x1, y1)
+        cells = cells[self.counts[cells] > 0]
+        inside = ((x0 <= self.cell_x_min[cells]) & (self.cell_x_max[cells] <= x1)
+                  & (y0 <= self.cell_y_min[cells]) & (self.cell_y_max[cells] <= y1))
+        outside = ((self.cell_x_max[cells] < x0) | (self.cell_x_min[cells] > x1)
+                   | (self.cell_y_max[cells] < y0) | (self.cell_y_min[cells] > y1))
+        candidates = self._points_in(cells[~inside & ~outside])
+        xs, ys = self.xs[candidates], self.ys[candidates]
+        tested = np.count_nonzero((x0 <= xs) & (xs <= x1) & (y0 <= ys) & (ys <= y1))
+        return int(self.counts[cells[inside]].sum()) + tested
+
+    def count_in_circle(self, cx: float, cy: float, r: float) -> int:
+        if r < 0 or not len(self.xs):
+            return 0
+        r2 = r * r
+        cells = self._cells_under(cx - r, cy - r, cx + r, cy + r)
+        cells = cells[self.counts[cells] > 0]
+        # Squared distances to the nearest and to the farthest point of each cell's box
+        near_x = np.maximum(np.maximum(self.cell_x_min[cells] - cx, cx - self.cell_x_max[cells]), 0)
+        near_y = np.maximum(np.maximum(self.cell_y_min[cells] - cy, cy - self.cell_y_max[cells]), 0)
+        far_x = np.maximum(np.abs(self.cell_x_min[cells] - cx), np.abs(self.cell_x_max[cells] - cx))
+        far_y = np.maximum(np.abs(self.cell_y_min[cells] - cy), np.abs(self.cell_y_max[cells] - cy))
+        inside = far_x * far_x + far_y * far_y <= r2
+        outside = near_x * near_x + near_y * near_y > r2
+        candidates = self._points_in(cells[~inside & ~outside])
+        dx, dy = self.xs[candidates] - cx, self.ys[candidates] - cy
+        tested = np.count_nonzero(dx * dx + dy * dy <= r2)
+        return int(self.counts[cells[inside]].sum()) + tested
+
+def count_points_in_shapes_indexed(points: Union[List[Point], 'PointArray'],
+                                   shapes: List[Union[Rectangle, Circle, 'RectArray', 'CircleArray']],
+                                   grid_size: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Grid-indexed equivalent of count_points_in_shapes.
+
+    Args:
+        points: The points to check, as a list of points or a PointArray.
+        shapes: The shapes to check against; RectArray and CircleArray entries are expanded.
+        grid_size: Number of grid cells per axis (chosen from the number of points if omitted).
+
+    Returns:
+        A tuple containing the number of points contained within rectangles and the number of points contained within circles.
+    """
+    if isinstance(points, PointArray):
+        grid = PointGrid(points.xs, points.ys, grid_size)
+    else:
+        grid = PointGrid([point.x for point in points], [point.y for point in points], grid_size)
+    num_points_in_rectangles = 0
+    num_points_in_circles = 0
+    for shape in shapes:
+        if isinstance(shape, Rectangle):
+            num_points_in_rectangles += grid.count_in_rectangle(shape.top_left.x, shape.top_left.y,
+                                                                shape.bottom_right.x, shape.bottom_right.y)
+        elif isinstance(shape, Circle):
+            num_points_in_circles += grid.count_in_circle(shape.center.x, shape.center.y, shape.radius)
+        elif isinstance(shape, RectArray):
+            for x0, y0, x1, y1 in zip(shape.x0.tolist(), shape.y0.tolist(), shape.x1.tolist(), shape.y1.tolist()):
+                num_points_in_rectangles += grid.count_in_rectangle(x0, y0, x1, y1)
+        elif isinstance(shape, CircleArray):
+            for cx, cy, r in zip(shape.cx.tolist(), shape.cy.tolist(), shape.radius.tolist()):
+                num_points_in_circles += grid.count_in_circle(cx, cy, r)
+    return num_points_in_rectangles, num_points_in_circles
+
+def benchmark() -> None:
+    """
+    Times count_points_in_shapes against count_points_in_shapes_indexed fed with generated arrays.
+    """
+    for n_points, n_shapes in [(1_000, 100), (10_000, 1_000), (100_000, 1_000), (1_000_000, 10_000)]:
+        rng = np.random.default_rng(0)
+        start = timeit.default_timer()
+        point_array = PointArray.random(n_points, rng)
+        shape_arrays = [RectArray.random(n_shapes // 2, rng), CircleArray.random(n_shapes // 2, rng)]
+        generated = timeit.default_timer() - start
+
+        start = timeit.default_timer()
+        result = count_points_in_shapes_indexed(point_array, shape_arrays)
+        indexed = timeit.default_timer() - start
+
+        if n_points * n_shapes <= 10_000_000:
+            points = list(point_array)
+            shapes = list(shape_arrays[0]) + list(shape_arrays[1])
+            start = timeit.default_timer()
+            assert count_points_in_shapes(points, shapes) == result
+            baseline = f"{timeit.default_timer() - start:8.3f}s"
+        else:
+            baseline = "    skip"
+        logging.info(f"points={n_points:>8} shapes={n_shapes:>6} | count_points_in_shapes {baseline} | generate arrays {generated:8.3f}s | indexed {indexed:8.3f}s")
+
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+        exit(0)
+
     try:
         n_points = int(input("Enter the number of points to generate: "))
         n_rectangles = int(input("Enter the number of rectangles to generate: "))
@@ -3,8 +3,15 @@
 ```python
 import logging
 import random
+import sys
+import os
+import timeit
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Tuple
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 ch = logging.StreamHandler()
@@ -51,6 +58,241 @@ def knapsack(items: List[Item], capacity: int) -> int:
     # Return the maximum total value.
     return dp[len(items)][capacity]
 
+# Above this many DP cells the rolling table gets expensive; with few items the
+# meet-in-the-middle search is used instead.
+MAX_DP_CELLS = 50_000_000
+MAX_MITM_ITEMS = 40
+
+def knapsack_rolling(items: List[Item], capacity: int, reconstruct: bool = False) -> Tuple[int, Optional[List[Item]]]:
+    """
+    Solves the 0/1 knapsack problem with a single NumPy row of O(capacity) memory.
+
+    Each item updates the row with one vectorized operation instead of an inner loop
+    over capacities. When reconstruction is requested, the take/skip decision of every
+    item is stored as a packed bitset (capacity + 1 bits per item) and walked backwards.
+
+    Parameters:
+        items (List[Item]): List of items, each with a name, value, and weight.
+        capacity (int): Capacity of the knapsack.
+        reconstruct (bool): Whether to return the chosen items as well.
+
+    Returns:
+        Tuple[int, Optional[List[Item]]]: Maximum total value and the chosen items (None if not reconstructed).
+    """
+
+    if capacity < 0:
+        return 0, [] if reconstruct else None
+
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+    decisions = np.zeros((len(items), (capacity + 8) // 8), dtype=np.uint8) if reconstruct else None
+    candidate = np.empty(capacity + 1, dtype=np.int64)
+
+    for i, item in enumerate(items):
+        w = item.weight
+        if w > capacity:
+            continue
+        # Values for "take the item", computed from the previous row before it is overwritten.
+        np.add(dp[:capacity + 1 - w], item.value, out=candidate[w:])
+        if decisions is not None:
+            take = np.zeros(capacity + 1, dtype=bool)
+            np.greater(candidate[w:], dp[w:], out=take[w:])
+            decisions[i] = np.packbits(take)
+        np.maximum(dp[w:], candidate[w:], out=dp[w:])
+
+    best = int(dp[capacity])
+    if decisions is None:
+        return best, None
+
+    chosen = []
+    remaining = capacity
+    for i in range(len(items) - 1, -1, -1):
+        if decisions[i, remaining >> 3] & (0x80 >> (remaining & 7)):
+            chosen.append(items[i])
+            remaining -= items[i].weight
+    chosen.reverse()
+    return best, chosen
+
+def _enumerate_subsets(items: List[Item]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Enumerates the weights, values, and bitmasks of every subset of a small list of items.
+    """
+
+    weights = np.zeros(1, dtype=np.int64)
+    values = np.zeros(1, dtype=np.int64)
+    masks = np.zeros(1, dtype=np.int64)
+    for i, item in enumerate(items):
+        weights = np.concatenate((weights, weights + item.weight))
+        values = np.concatenate((values, values + item.value))
+        masks = np.concatenate((masks, masks | (1 << i)))
+    return weights, values, masks
+
+def knapsack_meet_in_the_middle(items: List[Item], capacity: int, reconstruct: bool = False) -> Tuple[int, Optional[List[Item]]]:
+    """
+    Solves the 0/1 knapsack problem by splitting the items in two halves and matching subsets.
+
+    Runs in O(2^(n/2) * n) time independently of the capacity, so it is the method of
+    choice for very large capacities with few items.
+
+    Parameters:
+        items (List[Item]): List of items (at most MAX_MITM_ITEMS).
+        capacity (int): Capacity of the knapsack.
+        reconstruct (bool): Whether to return the chosen items as well.
+
+    Returns:
+        Tuple[int, Optional[List[Item]]]: Maximum total value and the chosen items (None if not reconstructed).
+    """
+
+    if len(items) > MAX_MITM_ITEMS:
+        raise ValueError(f"Meet-in-the-middle supports at most {MAX_MITM_ITEMS} items, got {len(items)}")
+    if capacity < 0:
+        return 0, [] if reconstruct else None
+
+    half = len(items) // 2
+    left, right = items[:half], items[half:]
+    left_weights, left_values, left_masks = _enumerate_subsets(left)
+    right_weights, right_values, right_masks = _enumerate_subsets(right)
+
+    # Sort the right half by weight and keep the best value seen up to each weight.
+    order = np.argsort(right_weights, kind="stable")
+    right_weights = right_weights[order]
+    right_values = right_values[order]
+    right_masks = right_masks[order]
+    running = np.maximum.accumulate(right_values)
+    # Index of the subset achieving the running maximum at each position.
+    best_index = np.maximum.accumulate(np.where(right_values == running, np.arange(len(right_values)), 0))
+
+    fits = left_weights <= capacity
+    left_weights, left_values, left_masks = left_weights[fits], left_values[fits], left_masks[fits]
+    positions = np.searchsorted(right_weights, capacity - left_weights, side="right") - 1
+    totals = left_values + running[positions]
+    winner = int(np.argmax(totals))
+    best = int(totals[winner])
+
+    if not reconstruct:
+        return best, None
+
+    left_mask = int(left_masks[winner])
+    right_mask = int(right_masks[best_index[positions[winner]]])
+    chosen = [item for i, item in enumerate(left) if left_mask >> i & 1]
+    chosen += [item for i, item in enumerate(right) if right_mask >> i & 1]
+    return best, chosen
+
+def solve_knapsack(items: List[Item], capacity: int, reconstruct: bool = False) -> Tuple[int, Optional[List[Item]]]:
+    """
+    Solves the 0/1 knapsack problem with the most suitable engine for the problem size.
+
+    Uses the rolling NumPy DP unless the table would be very large and there are few
+    enough items for the meet-in-the-middle search.
+
+    Parameters:
+        items (List[Item]): List of items, each with a name, value, and weight.
+        capacity (int): Capacity of the knapsack.
+        reconstruct (bool): Whether to return the chosen items as well.
+
+    Returns:
+        Tuple[int, Optional[List[Item]]]: Maximum total value and the chosen items (None if not reconstructed).
+    """
+
+    cells = len(items) * (capacity + 1)
+    if cells > MAX_DP_CELLS and len(items) <= MAX_MITM_ITEMS:
+        return knapsack_meet_in_the_middle(items, capacity, reconstruct)
+    return knapsack_rolling(items, capacity, reconstruct)
+
+def _knapsack_row(weights: np.ndarray, values: np.ndarray, capacity: int) -> np.ndarray:
+    """
+    Returns the final rolling DP row (best value for every capacity up to the given one).
+    """
+
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+    candidate = np.empty(capacity + 1, dtype=np.int64)
+    for w, v in zip(weights.tolist(), values.tolist()):
+        if w > capacity:
+            continue
+        np.add(dp[:capacity + 1 - w], v, out=candidate[w:])
+        np.maximum(dp[w:], candidate[w:], out=dp[w:])
+    return dp
+
+def _solve_group_shared(shm_name: str, total: int, start: int, stop: int, capacities: List[int]) -> List[int]:
+    """
+    Worker entry point: solves one group of problems whose items live in shared memory.
+    """
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        table = np.ndarray((2, total), dtype=np.int64, buffer=shm.buf)
+        weights = table[0, start:stop].copy()
+        values = table[1, start:stop].copy()
+        del table
+    finally:
+        shm.close()
+    dp = _knapsack_row(weights, values, max(max(capacities), 0))
+    return [int(dp[c]) if c >= 0 else 0 for c in capacities]
+
+def solve_knapsack_batch(problems: List[Tuple[List[Item], Bag]], workers: Optional[int] = None) -> List[int]:
+    """
+    Solves many knapsack problems at once.
+
+    Problems with identical item sets are grouped so that a single DP row, computed up to
+    the largest capacity in the group, answers all of them. The groups are then spread
+    over a process pool; item weights and values are placed in one shared memory block
+    so that only offsets are sent to the workers.
+
+    Parameters:
+        problems (List[Tuple[List[Item], Bag]]): Items and bag of every problem.
+        workers (Optional[int]): Number of worker processes (defaults to the CPU count, 1 runs in-process).
+
+    Returns:
+        List[int]: Maximum total value of every problem, in input order.
+    """
+
+    groups: Dict[Tuple[Tuple[int, int], ...], List[int]] = {}
+    for index, (items, _) in enumerate(problems):
+        # Knapsack results do not depend on item order, so the key is the sorted multiset
+        key = tuple(sorted((item.weight, item.value) for item in items))
+        groups.setdefault(key, []).append(index)
+
+    keys = list(groups)
+    offsets = [0]
+    for key in keys:
+        offsets.append(offsets[-1] + len(key))
+    total = offsets[-1]
+    capacities = [[problems[i][1].capacity for i in groups[key]] for key in keys]
+
+    results = [0] * len(problems)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(keys) == 1:
+        for key, caps in zip(keys, capacities):
+            weights = np.array([w for w, _ in key], dtype=np.int64)
+            values = np.array([v for _, v in key], dtype=np.int64)
+            dp = _knapsack_row(weights, values, max(max(caps), 0))
+            for i, c in zip(groups[key], caps):
+                results[i] = int(dp[c]) if c >= 0 else 0
+        return results
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 2 * total * 8))
+    try:
+        table = np.ndarray((2, total), dtype=np.int64, buffer=shm.buf)
+        for key, start in zip(keys, offsets):
+            for j, (w, v) in enumerate(key):
+                table[0, start + j] = w
+                table[1, start + j] = v
+        del table
+
+        # Submit the most expensive groups first so that the pool stays balanced.
+        order = sorted(range(len(keys)), key=lambda g: len(keys[g]) * max(capacities[g]), reverse=True)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                g: executor.submit(_solve_group_shared, shm.name, total, offsets[g], offsets[g + 1], capacities[g])
+                for g in order
+            }
+            for g, future in futures.items():
+                for i, value in zip(groups[keys[g]], future.result()):
+                    results[i] = value
+    finally:
+        shm.close()
+        shm.unlink()
+    return results
+
 def generate_random_items(num_items: int, max_value: int, max_weight: int) -> List[Item]:
     """
     Generates a list of random items with random values and weights.
@@ -94,6 +336,56 @@ def main():
     # Log the result.
     logger.info(f"Maximum total value: {max_value}")
 
+def benchmark():
+    """
+    Times the original table-based knapsack against the NumPy engines at several sizes.
+    """
+
+    random.seed(0)
+    sizes = [(10, 100), (100, 1_000), (200, 10_000), (1_000, 100_000), (30, 10**12)]
+    for num_items, capacity in sizes:
+        items = generate_random_items(num_items, 1_000, max(1, capacity // 10))
+        row = f"items={num_items:>6} capacity={capacity:>14}"
+
+        if num_items * (capacity + 1) <= 5_000_000:
+            start = timeit.default_timer()
+            expected = knapsack(items, capacity)
+            row += f" | knapsack {timeit.default_timer() - start:9.4f}s"
+        else:
+            expected = None
+            row += " | knapsack       skip"
+
+        start = timeit.default_timer()
+        value, chosen = solve_knapsack(items, capacity, reconstruct=True)
+        row += f" | solve_knapsack {timeit.default_timer() - start:9.4f}s"
+
+        assert sum(item.weight for item in chosen) <= capacity
+        assert sum(item.value for item in chosen) == value
+        assert expected is None or expected == value
+        print(row)
+
+def benchmark_batch():
+    """
+    Measures batch throughput in problems per second for an increasing number of workers.
+    """
+
+    random.seed(0)
+    item_sets = [generate_random_items(200, 1_000, 1_000) for _ in range(64)]
+    problems = [(random.choice(item_sets), generate_random_bag(random.randint(10_000, 50_000))) for _ in range(2_000)]
+    expected = None
+    for workers in [1, 2, 4, 8]:
+        start = timeit.default_timer()
+        results = solve_knapsack_batch(problems, workers=workers)
+        elapsed = timeit.default_timer() - start
+        expected = expected or results
+        assert results == expected
+        print(f"workers={workers} | {len(problems) / elapsed:10.1f} problems/s")
+
 if __name__ == "__main__":
-    main()
+    if "--benchmark" in sys.argv:
+        benchmark()
+    elif "--benchmark-batch" in sys.argv:
+        benchmark_batch()
+    else:
+        main()
 ```
\ No newline at end of file
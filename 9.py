@@ -1,22 +1,76 @@
 # Complex Python Program #9
 
 ```python
+import gc
+import heapq
 import random
 import logging
-from typing import List, Dict, Union
+import sys
+import timeit
+from typing import Iterable, Iterator, List, Dict, Union
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
 class Node:
+    __slots__ = ('value', 'left', 'right', 'size')
+
     def __init__(self, value: int, left: 'Node'=None, right: 'Node'=None):
         self.value = value
         self.left = left
         self.right = right
+        # Number of nodes in the subtree rooted here, kept up to date by every mutation
+        self.size = 1 + _size(left) + _size(right)
+
+def _size(node: 'Node') -> int:
+    return node.size if node is not None else 0
 
 class BinarySearchTree:
     def __init__(self):
         self.root: Node = None
 
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> 'BinarySearchTree':
+        # Builds a perfectly balanced tree in O(n) from values already in ascending order
+        values = values if isinstance(values, list) else list(values)
+        tree = cls()
+        # Millions of fresh nodes would otherwise trigger repeated, useless cyclic GC passes
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            tree.root = cls._build_balanced(values, 0, len(values))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return tree
+
+    @classmethod
+    def bulk_load(cls, values: Iterable[int]) -> 'BinarySearchTree':
+        return cls.from_sorted(sorted(values))
+
+    @staticmethod
+    def _build_balanced(values: List[int], lo: int, hi: int) -> Node:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        return Node(values[mid],
+                    BinarySearchTree._build_balanced(values, lo, mid),
+                    BinarySearchTree._build_balanced(values, mid + 1, hi))
+
+    def merge(self, other: 'BinarySearchTree') -> 'BinarySearchTree':
+        # Merges the two in-order streams and rebuilds once instead of inserting key by key
+        return self.from_sorted(heapq.merge(self._iter_inorder(self.root), other._iter_inorder(other.root)))
+
+    @staticmethod
+    def _iter_inorder(node: 'Node') -> Iterator[int]:
+        stack: List[Node] = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
     def insert(self, value: int) -> None:
         if self.root is None:
             self.root = Node(value)
@@ -24,6 +78,7 @@ class BinarySearchTree:
             self._insert(value, self.root)
 
     def _insert(self, value: int, current: 'Node') -> None:
+        current.size += 1
         if value < current.value:
             if current.left is None:
                 current.left = Node(value)
@@ -54,10 +109,10 @@ class BinarySearchTree:
         if self.root is None:
             return
 
-        parent: Node = None
+        path: List[Node] = []
         current: Node = self.root
         while current is not None and value != current.value:
-            parent = current
+            path.append(current)
             if value < current.value:
                 current = current.left
             else:
@@ -66,6 +121,10 @@ class BinarySearchTree:
         if current is None:
             return
 
+        for ancestor in path:
+            ancestor.size -= 1
+        parent: Node = path[-1] if path else None
+
         if current.left is None and current.right is None:
             if parent is None:
                 self.root = None
@@ -90,10 +149,8 @@ class BinarySearchTree:
         else:
             successor: Node = self._find_successor(current)
             current.value = successor.value
-            if successor.right is not None:
-                successor.right = self._remove_node(successor.right, successor.value)
-            else:
-                self._remove_node(successor.left, successor.value)
+            current.right = self._remove_node(current.right, successor.value)
+            current.size -= 1
 
     def _find_successor(self, node: 'Node') -> 'Node':
         current: Node = node.right
@@ -120,8 +177,67 @@ class BinarySearchTree:
                 successor: Node = self._find_successor(node)
                 node.value = successor.value
                 node.right = self._remove_node(node.right, successor.value)
+        node.size = 1 + _size(node.left) + _size(node.right)
         return node
 
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def select(self, k: int) -> int:
+        # k-th smallest key, 0-based, in O(height)
+        if not 0 <= k < len(self):
+            raise IndexError(f'select index {k} out of range for tree of size {len(self)}')
+        current: Node = self.root
+        while True:
+            left_size = _size(current.left)
+            if k < left_size:
+                current = current.left
+            elif k == left_size:
+                return current.value
+            else:
+                k -= left_size + 1
+                current = current.right
+
+    def rank(self, value: int) -> int:
+        # Number of keys strictly less than value
+        return self._count_below(value, inclusive=False)
+
+    def count_range(self, low: int, high: int) -> int:
+        # Number of keys in the closed interval [low, high]
+        if low > high:
+            return 0
+        return self._count_below(high, inclusive=True) - self._count_below(low, inclusive=False)
+
+    def _count_below(self, value: int, inclusive: bool) -> int:
+        count = 0
+        current: Node = self.root
+        while current is not None:
+            if current.value < value or (inclusive and current.value == value):
+                count += _size(current.left) + 1
+                current = current.right
+            else:
+                current = current.left
+        return count
+
+    def iter_range(self, low: int, high: int) -> Iterator[int]:
+        # Keys in [low, high] in ascending order, visiting only O(height + output) nodes
+        stack: List[Node] = []
+        current: Node = self.root
+        while stack or current is not None:
+            while current is not None:
+                if current.value < low:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            current = stack.pop()
+            if current.value > high:
+                return
+            yield current.value
+            current = current.right
+
     def is_balanced(self) -> bool:
         if self.root is None:
             return True
@@ -161,16 +277,60 @@ class RandomTreeGenerator:
         self.max_value = max_value
 
     def generate(self) -> BinarySearchTree:
-        tree = BinarySearchTree()
-        for _ in range(self.size):
-            value = random.randint(1, self.max_value)
-            tree.insert(value)
-        return tree
+        return BinarySearchTree.bulk_load(random.randint(1, self.max_value) for _ in range(self.size))
+
+def _height(node: 'Node') -> int:
+    height = 0
+    level = [node] if node is not None else []
+    while level:
+        height += 1
+        level = [child for n in level for child in (n.left, n.right) if child is not None]
+    return height
+
+def benchmark(size: int = 5_000_000, insert_size: int = 200_000) -> None:
+    values = [random.randint(1, size) for _ in range(size)]
+
+    start = timeit.default_timer()
+    tree = BinarySearchTree()
+    for value in values[:insert_size]:
+        tree.insert(value)
+    logging.info(f'insert x{insert_size}: {timeit.default_timer() - start:.2f}s, height {_height(tree.root)}')
+
+    start = timeit.default_timer()
+    tree = BinarySearchTree.bulk_load(values)
+    logging.info(f'bulk_load x{size}: {timeit.default_timer() - start:.2f}s, height {_height(tree.root)}')
+
+    queries = [random.randint(1, size) for _ in range(1000)]
+    start = timeit.default_timer()
+    for q in queries:
+        tree.select(q % size)
+        tree.rank(q)
+        tree.count_range(q, q + 1000)
+        sum(1 for _ in tree.iter_range(q, q + 1000))
+    logging.info(f'select/rank/count_range/iter_range x{len(queries)}: {timeit.default_timer() - start:.3f}s')
+
+    start = timeit.default_timer()
+    for q in queries[:5]:
+        keys = list(BinarySearchTree._iter_inorder(tree.root))
+        keys[q % size]
+        sum(1 for key in keys if key < q)
+        sum(1 for key in keys if q <= key <= q + 1000)
+        [key for key in keys if q <= key <= q + 1000]
+    logging.info(f'materialize-and-scan x5: {timeit.default_timer() - start:.3f}s')
+
+    half = size // 2
+    left, right = BinarySearchTree.bulk_load(values[:half]), BinarySearchTree.bulk_load(values[half:])
+    start = timeit.default_timer()
+    merged = left.merge(right)
+    logging.info(f'merge {half} + {size - half}: {timeit.default_timer() - start:.2f}s, height {_height(merged.root)}')
 
 if __name__ == '__main__':
-    size = 10
-    max_value = 100
-    generator = RandomTreeGenerator(size, max_value)
-    tree = generator.generate()
-    logging.info(f'Generated random tree: {tree}')
+    if '--benchmark' in sys.argv:
+        benchmark()
+    else:
+        size = 10
+        max_value = 100
+        generator = RandomTreeGenerator(size, max_value)
+        tree = generator.generate()
+        logging.info(f'Generated random tree: {tree}')
 ```
\ No newline at end of file
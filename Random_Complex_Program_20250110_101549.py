@@ -3,30 +3,41 @@
 ```python
 from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass, field
+import math
 import random
 import logging
+import sys
+import timeit
 
 logging.basicConfig(level=logging.DEBUG)
 
-@dataclass
+@dataclass(eq=False)
 class Node:
     """
-    A node in a randomized binary tree.
+    A node in a randomized binary tree (treap).
+
+    Nodes compare by identity so that child checks stay O(1) instead of deep-comparing subtrees.
 
     Args:
         value (int): The value stored in the node.
         left: Left child node.
         right: Right child node.
+        priority (float): Random heap priority; every node's priority is at least its children's.
     """
     value: int
     left: Optional['Node'] = None
     right: Optional['Node'] = None
+    priority: float = field(default_factory=random.random)
 
 @dataclass
 class RandomizedBinaryTree:
     """
     A randomized binary tree that supports efficient search, insertion, and deletion.
 
+    The tree is a treap: values are in binary-search-tree order and random priorities are in max-heap
+    order, which keeps the expected height O(log n) whatever the insertion order. All operations are
+    iterative, so even an unlucky tall tree cannot hit the recursion limit.
+
     Args:
         root: Root node of the tree.
     """
@@ -41,29 +52,26 @@ class RandomizedBinaryTree:
         """
         logging.debug(f"Inserting {value} into the tree.")
 
-        if self.root is None:
-            self.root = Node(value)
-        else:
-            self._insert_helper(self.root, value)
+        node = Node(value)
+        path: List[Node] = []
+        current = self.root
+        while current is not None:
+            path.append(current)
+            current = current.left if value < current.value else current.right
 
-    def _insert_helper(self, node: Node, value: int) -> None:
-        """
-        Recursive helper method for insertion.
-
-        Args:
-            node (Node): The current node.
-            value (int): The value to insert.
-        """
-        if value < node.value:
-            if node.left is None:
-                node.left = Node(value)
-            else:
-                self._insert_helper(node.left, value)
+        if not path:
+            self.root = node
+            return
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = node
         else:
-            if node.right is None:
-                node.right = Node(value)
-            else:
-                self._insert_helper(node.right, value)
+            parent.right = node
+
+        # Rotate the new node up until the heap order on priorities holds again
+        while path and path[-1].priority < node.priority:
+            parent = path.pop()
+            self._replace_child(path[-1] if path else None, parent, self._rotate_up(parent, node))
 
     def search(self, value: int) -> Optional[Node]:
         """
@@ -77,30 +85,10 @@ class RandomizedBinaryTree:
         """
         logging.debug(f"Searching for {value} in the tree.")
 
-        if self.root is None:
-            return None
-        else:
-            return self._search_helper(self.root, value)
-
-    def _search_helper(self, node: Node, value: int) -> Optional[Node]:
-        """
-        Recursive helper method for search.
-
-        Args:
-            node (Node): The current node.
-            value (int): The value to search for.
-
-        Returns:
-            Node or None: The node containing the value, or None if the value is not found.
-        """
-        if node is None:
-            return None
-        elif node.value == value:
-            return node
-        elif value < node.value:
-            return self._search_helper(node.left, value)
-        else:
-            return self._search_helper(node.right, value)
+        current = self.root
+        while current is not None and current.value != value:
+            current = current.left if value < current.value else current.right
+        return current
 
     def delete(self, value: int) -> None:
         """
@@ -111,122 +99,244 @@ class RandomizedBinaryTree:
         """
         logging.debug(f"Deleting {value} from the tree.")
 
-        if self.root is None:
-            return
-
-        # Find the node to delete
-        node_to_delete = self._search_helper(self.root, value)
-        if node_to_delete is None:
+        parent: Optional[Node] = None
+        node = self.root
+        while node is not None and node.value != value:
+            parent = node
+            node = node.left if value < node.value else node.right
+        if node is None:
             return
 
-        # Case 1: Node to delete has no children
-        if node_to_delete.left is None and node_to_delete.right is None:
-            self._delete_helper(node_to_delete)
+        # Rotate the node down past its higher-priority child until it has at most one child
+        while node.left is not None and node.right is not None:
+            child = node.left if node.left.priority > node.right.priority else node.right
+            self._replace_child(parent, node, self._rotate_up(node, child))
+            parent = child
 
-        # Case 2: Node to delete has one child
-        elif node_to_delete.left is None:
-            self._delete_helper(node_to_delete, node_to_delete.right)
-        elif node_to_delete.right is None:
-            self._delete_helper(node_to_delete, node_to_delete.left)
-
-        # Case 3: Node to delete has two children
-        else:
-            # Find the successor of the node to delete
-            successor = self._find_successor(node_to_delete)
+        self._replace_child(parent, node, node.left if node.left is not None else node.right)
 
-            # Copy the successor's value to the node to delete
-            node_to_delete.value = successor.value
+    def split(self, key: int) -> 'RandomizedBinaryTree':
+        """
+        Splits off every value greater than or equal to key in expected O(log n) time.
 
-            # Delete the successor
-            self._delete_helper(successor)
+        Args:
+            key (int): The split point.
 
-    def _delete_helper(self, node: Node, child: Optional[Node] = None) -> None:
+        Returns:
+            RandomizedBinaryTree: A tree with the values >= key; this tree keeps the values < key.
         """
-        Recursive helper method for deletion.
+        left_tail: Optional[Node] = None
+        right_tail: Optional[Node] = None
+        left_root: Optional[Node] = None
+        right_root: Optional[Node] = None
+
+        current = self.root
+        while current is not None:
+            if current.value < key:
+                # current and its left subtree belong to the lower tree; keep splitting its right subtree
+                if left_tail is None:
+                    left_root = current
+                else:
+                    left_tail.right = current
+                left_tail = current
+                current = current.right
+            else:
+                if right_tail is None:
+                    right_root = current
+                else:
+                    right_tail.left = current
+                right_tail = current
+                current = current.left
+
+        if left_tail is not None:
+            left_tail.right = None
+        if right_tail is not None:
+            right_tail.left = None
+        self.root = left_root
+        return RandomizedBinaryTree(right_root)
+
+    def join(self, other: 'RandomizedBinaryTree') -> None:
+        """
+        Moves every value of other into this tree in expected O(log n) time, leaving other empty.
 
         Args:
-            node (Node): The node to delete.
-            child (Node, optional): The child of the node to delete. Defaults to None.
+            other (RandomizedBinaryTree): A tree whose values are all >= the values of this tree.
+
+        Raises:
+            ValueError: If the value ranges of the two trees overlap.
         """
-        if node.left is None and node.right is None:
-            # Node has no children
-            if node == self.root:
-                self.root = None
+        if self.root is not None and other.root is not None and self._max().value > other._min().value:
+            raise ValueError("join requires every value of other to be >= every value of this tree")
+
+        parent: Optional[Node] = None
+        attach_right = False
+        low, high = self.root, other.root
+        self.root = None
+        while low is not None and high is not None:
+            # The higher priority root stays on top; merge continues on its inner spine
+            if low.priority > high.priority:
+                top, low = low, low.right
+                inner_right = True
             else:
-                parent = self._find_parent(node)
-                if parent.left == node:
-                    parent.left = None
-                else:
-                    parent.right = None
+                top, high = high, high.left
+                inner_right = False
+            if parent is None:
+                self.root = top
+            elif attach_right:
+                parent.right = top
+            else:
+                parent.left = top
+            parent, attach_right = top, inner_right
+
+        rest = low if low is not None else high
+        if parent is None:
+            self.root = rest
+        elif attach_right:
+            parent.right = rest
         else:
-            # Node has one child
-            if child is not None:
-                if node == self.root:
-                    self.root = child
-                else:
-                    parent = self._find_parent(node)
-                    if parent.left == node:
-                        parent.left = child
-                    else:
-                        parent.right = child
+            parent.left = rest
+        other.root = None
 
-    def _find_parent(self, node: Node) -> Node:
+    def _rotate_up(self, parent: Node, child: Node) -> Node:
         """
-        Finds the parent of a node in the tree.
+        Rotates child above parent.
 
         Args:
-            node (Node): The node to find the parent of.
+            parent (Node): The node to rotate down.
+            child (Node): A child of parent.
 
         Returns:
-            Node: The parent node.
+            Node: The new root of the rotated subtree (child).
         """
-        if node == self.root:
-            return None
-
-        parent = self.root
-        while parent.left != node and parent.right != node:
-            if node.value < parent.value:
-                parent = parent.left
-            else:
-                parent = parent.right
-
-        return parent
+        if parent.left is child:
+            parent.left, child.right = child.right, parent
+        else:
+            parent.right, child.left = child.left, parent
+        return child
 
-    def _find_successor(self, node: Node) -> Node:
+    def _replace_child(self, parent: Optional[Node], old: Node, new: Optional[Node]) -> None:
         """
-        Finds the successor of a node in the tree.
+        Points the link from parent that referenced old at new.
 
         Args:
-            node (Node): The node to find the successor of.
+            parent (Node, optional): The parent of old, or None when old is the root.
+            old (Node): The current child.
+            new (Node, optional): The replacement subtree.
+        """
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _min(self) -> Node:
+        """
+        Finds the node with the smallest value in a non-empty tree.
 
         Returns:
-            Node: The successor node.
+            Node: The leftmost node.
         """
-        successor = node.right
-        while successor.left is not None:
-            successor = successor.left
+        node = self.root
+        while node.left is not None:
+            node = node.left
+        return node
 
-        return successor
+    def _max(self) -> Node:
+        """
+        Finds the node with the largest value in a non-empty tree.
 
-    def print(self) -> None:
+        Returns:
+            Node: The rightmost node.
         """
-        Prints the tree in a pretty format.
+        node = self.root
+        while node.right is not None:
+            node = node.right
+        return node
+
+    def height(self) -> int:
         """
-        self._print_helper(self.root, 0)
+        Computes the height of the tree.
 
-    def _print_helper(self, node: Optional[Node], level: int) -> None:
+        Returns:
+            int: The number of nodes on the longest root-to-leaf path.
         """
-        Recursive helper method for printing the tree.
+        height = 0
+        stack = [(self.root, 1)] if self.root is not None else []
+        while stack:
+            node, depth = stack.pop()
+            height = max(height, depth)
+            for child in (node.left, node.right):
+                if child is not None:
+                    stack.append((child, depth + 1))
+        return height
+
+    def inorder(self) -> List[int]:
+        """
+        Lists the values of the tree in ascending order.
 
-        Args:
-            node (Node): The current node.
-            level (int): The level of the current node.
+        Returns:
+            List[int]: The sorted values.
         """
-        if node is None:
-            return
+        values: List[int] = []
+        stack: List[Node] = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            values.append(node.value)
+            node = node.right
+        return values
 
-        print(" " * level, node.value)
-        self._print_helper(node.left, level + 1)
-        self._print_helper(node.right, level + 1)
+    def print(self) -> None:
+        """
+        Prints the tree in a pretty format.
+        """
+        stack = [(self.root, 0)] if self.root is not None else []
+        while stack:
+            node, level = stack.pop()
+            print(" " * level, node.value)
+            if node.right is not None:
+                stack.append((node.right, level + 1))
+            if node.left is not None:
+                stack.append((node.left, level + 1))
+
+def benchmark(n: int = 1_000_000) -> None:
+    """
+    Times the tree on worst-case input for an unbalanced BST: n keys inserted in ascending order.
 
-```
\ No newline at end of file
+    Args:
+        n (int): The number of keys.
+    """
+    logging.getLogger().setLevel(logging.INFO)
+    tree = RandomizedBinaryTree()
+
+    start = timeit.default_timer()
+    for value in range(n):
+        tree.insert(value)
+    print(f"insert {n} sorted keys: {timeit.default_timer() - start:.2f}s, "
+          f"height {tree.height()} (log2 n = {math.log2(n):.1f}, unbalanced BST would be {n})")
+
+    start = timeit.default_timer()
+    for value in range(n):
+        tree.search(value)
+    print(f"search {n} keys: {timeit.default_timer() - start:.2f}s")
+
+    start = timeit.default_timer()
+    upper = tree.split(n // 2)
+    middle = tree.split(n // 4)
+    tree.join(middle)
+    tree.join(upper)
+    print(f"2 splits + 2 joins: {(timeit.default_timer() - start) * 1e6:.0f}us, height {tree.height()}")
+
+    start = timeit.default_timer()
+    for value in range(n - 1, -1, -1):
+        tree.delete(value)
+    print(f"delete {n} keys in descending order: {timeit.default_timer() - start:.2f}s")
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+```
@@ -1,8 +1,56 @@
 # Task: Implement a basic neural network from scratch
 
 ```python
+import json
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
 import numpy as np
 
+
+# Saved model files start with the magic bytes, the format version and the header size
+MODEL_MAGIC = b'NNET'
+MODEL_VERSION = 1
+MODEL_PREFIX = 12
+MODEL_ALIGNMENT = 64
+
+
+def _align(offset):
+    return -(-offset // MODEL_ALIGNMENT) * MODEL_ALIGNMENT
+
+
+def _model_offsets(shapes):
+    """
+    Offsets of the saved arrays relative to the start of the data section.
+    """
+    offsets = []
+    offset = 0
+    for shape in shapes:
+        offsets.append(offset)
+        offset = _align(offset + int(np.prod(shape)) * 8)
+    return offsets
+
+
+def _activate_inplace(z, activation):
+    """
+    Applies the named activation function to z in place.
+    """
+    if activation == 'relu':
+        np.maximum(z, 0, out=z)
+    elif activation == 'sigmoid':
+        np.negative(z, out=z)
+        np.exp(z, out=z)
+        z += 1
+        np.reciprocal(z, out=z)
+
+
 class NeuralNetwork:
     def __init__(self, layers, activation='relu'):
         """
@@ -14,6 +62,8 @@ class NeuralNetwork:
         self.activation = activation
         self.weights = []
         self.biases = []
+        # Training buffers, keyed by minibatch size
+        self._buffers = {}
 
         # Initialize weights and biases
         for i in range(1, len(layers)):
@@ -42,40 +92,227 @@ class NeuralNetwork:
             y: Target output.
             lr: Learning rate.
         """
-        # Forward pass
-        out = self.forward(x)
+        # Forward pass, keeping the output of every layer
+        activations = [x]
+        for i in range(len(self.layers) - 1):
+            z = np.dot(activations[-1], self.weights[i]) + self.biases[i]
+            if self.activation == 'relu':
+                z = np.maximum(0, z)
+            elif self.activation == 'sigmoid':
+                z = 1 / (1 + np.exp(-z))
+            activations.append(z)
 
-        # Calculate the error
-        error = y - out
+        # Calculate the error (gradient of the squared error with respect to the output)
+        error = activations[-1] - y
 
         # Backpropagate the error
-        for i in range(len(self.layers) - 1, 0, -1):
+        for i in range(len(self.layers) - 2, -1, -1):
+            out = activations[i + 1]
             if self.activation == 'relu':
                 grad = np.where(out > 0, 1, 0)
             elif self.activation == 'sigmoid':
                 grad = out * (1 - out)
+            else:
+                grad = 1
 
             grad = error * grad
             error = np.dot(grad, self.weights[i].T)
 
             # Update weights and biases
-            self.weights[i] -= lr * np.dot(x.T, grad)
+            self.weights[i] -= lr * np.dot(activations[i].T, grad)
             self.biases[i] -= lr * np.sum(grad, axis=0)
 
-    def train(self, x, y, epochs=1000, batch_size=32, lr=0.01):
+    def _buffers_for(self, rows):
+        """
+        Args:
+            rows: Number of rows in the minibatch.
+        Returns:
+            Preallocated activation, delta, scratch and gradient buffers for that batch size.
+        """
+        buffers = self._buffers.get(rows)
+        if buffers is None:
+            sizes = self.layers[1:]
+            buffers = {
+                'activations': [np.empty((rows, n)) for n in sizes],
+                'deltas': [np.empty((rows, n)) for n in sizes],
+                'scratch': [np.empty((rows, n)) for n in sizes],
+                'weight_grads': [np.empty_like(w) for w in self.weights],
+                'bias_grads': [np.empty_like(b) for b in self.biases],
+            }
+            self._buffers[rows] = buffers
+        return buffers
+
+    def _activate(self, z):
+        """
+        Applies the activation function to z in place.
+        """
+        _activate_inplace(z, self.activation)
+
+    def _scale_by_derivative(self, delta, out, scratch):
+        """
+        Multiplies delta in place by the activation derivative, given the layer output.
         """
+        if self.activation == 'relu':
+            np.greater(out, 0, out=scratch)
+            delta *= scratch
+        elif self.activation == 'sigmoid':
+            np.subtract(1, out, out=scratch)
+            np.multiply(out, scratch, out=scratch)
+            delta *= scratch
+
+    def _gradients(self, x, y):
+        """
+        Computes the weight and bias gradients of one minibatch into the preallocated
+        buffers, reusing the layer activations from the forward pass.
+
         Args:
             x: Input data.
             y: Target output.
+        Returns:
+            The buffers holding the gradients ('weight_grads' and 'bias_grads').
+        """
+        buffers = self._buffers_for(len(x))
+        activations = buffers['activations']
+        deltas = buffers['deltas']
+        scratch = buffers['scratch']
+        layers = len(self.weights)
+
+        # Forward pass: matrix product, then bias-add and activation in place
+        inputs = x
+        for i in range(layers):
+            np.dot(inputs, self.weights[i], out=activations[i])
+            activations[i] += self.biases[i]
+            self._activate(activations[i])
+            inputs = activations[i]
+
+        np.subtract(activations[-1], y, out=deltas[-1])
+        self._scale_by_derivative(deltas[-1], activations[-1], scratch[-1])
+
+        for i in range(layers - 1, -1, -1):
+            previous = activations[i - 1] if i > 0 else x
+            np.dot(previous.T, deltas[i], out=buffers['weight_grads'][i])
+            np.sum(deltas[i], axis=0, keepdims=True, out=buffers['bias_grads'][i])
+            if i > 0:
+                np.dot(deltas[i], self.weights[i].T, out=deltas[i - 1])
+                self._scale_by_derivative(deltas[i - 1], activations[i - 1], scratch[i - 1])
+        return buffers
+
+    def _apply_gradients(self, weight_grads, bias_grads, lr):
+        """
+        Updates the weights and biases in place; the gradient arrays are scaled by lr.
+        """
+        for i in range(len(self.weights)):
+            weight_grads[i] *= lr
+            self.weights[i] -= weight_grads[i]
+            bias_grads[i] *= lr
+            self.biases[i] -= bias_grads[i]
+
+    def _train_step(self, x, y, lr):
+        """
+        Same update as backward, but the layer activations from the forward pass are
+        reused and all temporaries are written in place into buffers sized to the batch.
+
+        Args:
+            x: Input data.
+            y: Target output.
+            lr: Learning rate.
+        """
+        buffers = self._gradients(x, y)
+        self._apply_gradients(buffers['weight_grads'], buffers['bias_grads'], lr)
+
+    def _parameter_shapes(self):
+        return [w.shape for w in self.weights] + [b.shape for b in self.biases]
+
+    def train(self, x, y=None, epochs=1000, batch_size=32, lr=0.01, buffered=True, workers=1):
+        """
+        Args:
+            x: Input data, or a DataLoader yielding (input, target) batches.
+            y: Target output (unused when x is a DataLoader).
             epochs: Number of epochs to train for.
-            batch_size: Batch size.
+            batch_size: Batch size (a DataLoader uses its own).
             lr: Learning rate.
+            buffered: Use the cached-activation, preallocated-buffer training step
+                instead of backward.
+            workers: Number of worker processes. With more than one, every minibatch is
+                split across the workers, which compute gradients against weights held in
+                shared memory; the gradients are summed before the update.
         """
+        if isinstance(x, DataLoader):
+            batches = x
+        else:
+            batches = [(x[i:i+batch_size], y[i:i+batch_size]) for i in range(0, len(x), batch_size)]
+
+        if workers > 1:
+            self._train_parallel(batches, epochs, lr, workers)
+            return
+
+        step = self._train_step if buffered else self.backward
         for epoch in range(epochs):
-            for i in range(0, len(x), batch_size):
-                batch_x = x[i:i+batch_size]
-                batch_y = y[i:i+batch_size]
-                self.backward(batch_x, batch_y, lr)
+            for batch_x, batch_y in batches:
+                step(batch_x, batch_y, lr)
+
+    def _train_parallel(self, batches, epochs, lr, workers):
+        """
+        Data-parallel version of train. Parameters, the current minibatch and one gradient
+        slot per worker live in shared memory, so only row ranges are sent to the workers.
+        """
+        if isinstance(batches, DataLoader):
+            rows = batches.batch_size
+        else:
+            rows = max((len(batch_x) for batch_x, _ in batches), default=0)
+        x_shape = (rows, self.layers[0])
+        y_shape = (rows, self.layers[-1])
+        shapes = self._parameter_shapes()
+        size = sum(int(np.prod(shape)) for shape in shapes)
+
+        blocks = {
+            'parameters': shared_memory.SharedMemory(create=True, size=size * 8),
+            'gradients': shared_memory.SharedMemory(create=True, size=workers * size * 8),
+            'x': shared_memory.SharedMemory(create=True, size=max(int(np.prod(x_shape)) * 8, 1)),
+            'y': shared_memory.SharedMemory(create=True, size=max(int(np.prod(y_shape)) * 8, 1)),
+        }
+        originals = self.weights, self.biases
+        try:
+            parameters = _shared_views(blocks['parameters'].buf, shapes)
+            for view, value in zip(parameters, self.weights + self.biases):
+                view[...] = value
+            self.weights = parameters[:len(originals[0])]
+            self.biases = parameters[len(originals[0]):]
+            gradients = [_shared_views(blocks['gradients'].buf, shapes, slot * size * 8) for slot in range(workers)]
+            shared_x = np.ndarray(x_shape, dtype=np.float64, buffer=blocks['x'].buf)
+            shared_y = np.ndarray(y_shape, dtype=np.float64, buffer=blocks['y'].buf)
+
+            names = {key: block.name for key, block in blocks.items()}
+            with ProcessPoolExecutor(workers, initializer=_attach_training_worker,
+                                     initargs=(self.layers, self.activation, names, x_shape, y_shape, size)) as executor:
+                for epoch in range(epochs):
+                    for batch_x, batch_y in batches:
+                        count = len(batch_x)
+                        shared_x[:count] = batch_x
+                        shared_y[:count] = batch_y
+                        bounds = np.linspace(0, count, workers + 1).astype(int)
+                        shards = [(slot, start, stop) for slot, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])) if stop > start]
+                        for future in [executor.submit(_shard_gradients, *shard) for shard in shards]:
+                            future.result()
+
+                        # All-reduce: sum the per-shard gradients into the first slot used
+                        total = gradients[shards[0][0]]
+                        for slot, _, _ in shards[1:]:
+                            for accumulated, partial in zip(total, gradients[slot]):
+                                accumulated += partial
+                        layers = len(self.weights)
+                        self._apply_gradients(total[:layers], total[layers:], lr)
+
+            self.weights = [w.copy() for w in self.weights]
+            self.biases = [b.copy() for b in self.biases]
+        except BaseException:
+            self.weights, self.biases = originals
+            raise
+        finally:
+            parameters = gradients = total = shared_x = shared_y = None
+            for block in blocks.values():
+                block.close()
+                block.unlink()
 
     def predict(self, x):
         """
@@ -85,4 +322,398 @@ class NeuralNetwork:
             Predicted output.
         """
         return self.forward(x)
+
+    def save(self, path):
+        """
+        Writes the network to a single binary file: a small header describing the layers
+        and activation, followed by every weight and bias array as raw little-endian
+        float64 data aligned to 64 bytes.
+
+        Args:
+            path: File to write.
+        """
+        arrays = self.weights + self.biases
+        offsets = _model_offsets(self._parameter_shapes())
+        header = json.dumps({'layers': list(self.layers), 'activation': self.activation}).encode()
+        with open(path, 'wb') as f:
+            f.write(MODEL_MAGIC + struct.pack('<II', MODEL_VERSION, len(header)) + header)
+            for array, offset in zip(arrays, offsets):
+                f.write(b'\0' * (_align(MODEL_PREFIX + len(header)) + offset - f.tell()))
+                f.write(np.ascontiguousarray(array, dtype='<f8').tobytes())
+
+    @classmethod
+    def load(cls, path, mode='r'):
+        """
+        Memory maps a network written by save; no weight data is copied, so processes
+        loading the same file share its physical pages.
+
+        Args:
+            path: File to read.
+            mode: 'r' for read-only weights, or 'c' for copy-on-write weights that can be
+                trained further without modifying the file.
+        Returns:
+            The loaded NeuralNetwork.
+        """
+        access = {'r': mmap.ACCESS_READ, 'c': mmap.ACCESS_COPY}[mode]
+        with open(path, 'rb') as f:
+            prefix = f.read(MODEL_PREFIX)
+            if len(prefix) < MODEL_PREFIX or prefix[:4] != MODEL_MAGIC:
+                raise ValueError(f"{path} is not a saved NeuralNetwork")
+            version, header_size = struct.unpack('<II', prefix[4:])
+            if version != MODEL_VERSION:
+                raise ValueError(f"Unsupported model version: {version}")
+            header = json.loads(f.read(header_size))
+            mapped = mmap.mmap(f.fileno(), 0, access=access)
+
+        network = cls.__new__(cls)
+        network.layers = header['layers']
+        network.activation = header['activation']
+        network._buffers = {}
+        network._mapped = mapped
+        shapes = [(network.layers[i - 1], network.layers[i]) for i in range(1, len(network.layers))]
+        shapes += [(1, n) for n in network.layers[1:]]
+        base = _align(MODEL_PREFIX + header_size)
+        arrays = [np.ndarray(shape, dtype='<f8', buffer=mapped, offset=base + offset)
+                  for shape, offset in zip(shapes, _model_offsets(shapes))]
+        network.weights = arrays[:len(shapes) // 2]
+        network.biases = arrays[len(shapes) // 2:]
+        return network
+
+    def freeze(self, precision='float32', chunk_size=65536):
+        """
+        Args:
+            precision: 'float32', or 'int8' to also quantize the weights per layer.
+            chunk_size: Number of input rows pushed through the network at a time.
+        Returns:
+            An InferenceEngine holding a frozen copy of the current weights.
+        """
+        return InferenceEngine(self, precision, chunk_size)
+
+
+class InferenceEngine:
+    """
+    Float32 inference for a trained NeuralNetwork.
+
+    Weights are frozen into contiguous float32 arrays, or stored as int8 with one scale
+    per layer. Inputs are streamed in fixed-size chunks through preallocated buffers, so
+    memory use does not depend on the number of input rows (apart from the output).
+    """
+
+    def __init__(self, network, precision='float32', chunk_size=65536):
+        """
+        Args:
+            network: The NeuralNetwork to freeze.
+            precision: 'float32', or 'int8' to also quantize the weights per layer.
+            chunk_size: Number of input rows pushed through the network at a time.
+        """
+        if precision not in ('float32', 'int8'):
+            raise ValueError(f"Unsupported precision: {precision}")
+        self.network = network
+        self.layers = list(network.layers)
+        self.activation = network.activation
+        self.precision = precision
+        self.chunk_size = chunk_size
+        self.biases = [np.ascontiguousarray(b, dtype=np.float32) for b in network.biases]
+        if precision == 'int8':
+            self.scales = [float(np.abs(w).max()) / 127 or 1.0 for w in network.weights]
+            self.weights = [np.ascontiguousarray(np.round(w / scale), dtype=np.int8)
+                            for w, scale in zip(network.weights, self.scales)]
+        else:
+            self.scales = None
+            self.weights = [np.ascontiguousarray(w, dtype=np.float32) for w in network.weights]
+        self._inputs = np.empty((chunk_size, self.layers[0]), dtype=np.float32)
+        self._activations = [np.empty((chunk_size, n), dtype=np.float32) for n in self.layers[1:]]
+
+    def _float_weights(self):
+        """
+        Returns the float32 weights used by matrix products, dequantizing int8 weights.
+        """
+        if self.scales is None:
+            return self.weights
+        return [w.astype(np.float32) * np.float32(scale) for w, scale in zip(self.weights, self.scales)]
+
+    def predict(self, x, out=None):
+        """
+        Args:
+            x: Input data (any array-like supporting row slicing, e.g. a memory map).
+            out: Optional float32 array receiving the output.
+        Returns:
+            Predicted output as float32.
+        """
+        if out is None:
+            out = np.empty((len(x), self.layers[-1]), dtype=np.float32)
+        weights = self._float_weights()
+        for start in range(0, len(x), self.chunk_size):
+            stop = min(start + self.chunk_size, len(x))
+            rows = stop - start
+            inputs = self._inputs[:rows]
+            np.copyto(inputs, x[start:stop], casting='unsafe')
+            for i, (w, b) in enumerate(zip(weights, self.biases)):
+                z = self._activations[i][:rows]
+                np.dot(inputs, w, out=z)
+                z += b
+                _activate_inplace(z, self.activation)
+                inputs = z
+            out[start:stop] = inputs
+        return out
+
+    def accuracy_delta(self, x):
+        """
+        Args:
+            x: Input data to compare on.
+        Returns:
+            Largest absolute output difference against the float64 network, and the
+            fraction of rows whose argmax prediction differs.
+        """
+        reference = self.network.forward(np.asarray(x, dtype=np.float64))
+        frozen = self.predict(x)
+        max_error = float(np.abs(reference - frozen).max()) if len(reference) else 0.0
+        mismatch = float(np.mean(reference.argmax(axis=1) != frozen.argmax(axis=1))) if len(reference) else 0.0
+        return max_error, mismatch
+
+
+class DataLoader:
+    """
+    Iterates shuffled (input, target) minibatches for NeuralNetwork.train.
+
+    Arrays given as paths to .npy files are memory mapped; after each batch is copied
+    out, the mapped pages are released again, so resident memory does not grow with the
+    dataset. Shuffling permutes row indices, not the data, and a background thread
+    prepares the next batches while one is trained on.
+    """
+
+    def __init__(self, x, y, batch_size=32, shuffle=True, seed=None, prefetch=2):
+        """
+        Args:
+            x: Input data, as an array or the path of a .npy file.
+            y: Target output, as an array or the path of a .npy file.
+            batch_size: Batch size.
+            shuffle: Visit the rows in a new random order every epoch.
+            seed: Seed of the shuffling generator.
+            prefetch: Number of batches prepared ahead of the training loop.
+        """
+        self._maps = []
+        self.x = self._open(x)
+        self.y = self._open(y)
+        if len(self.x) != len(self.y):
+            raise ValueError(f"x has {len(self.x)} rows but y has {len(self.y)}")
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.prefetch = prefetch
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return -(-len(self.x) // self.batch_size)
+
+    def _open(self, data):
+        """
+        Returns arrays unchanged and memory maps .npy files given by path.
+        """
+        if not isinstance(data, (str, os.PathLike)):
+            return data
+        with open(data, 'rb') as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if fortran_order:
+                raise ValueError(f"{data} is stored in Fortran order")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            offset = f.tell()
+        self._maps.append(mapped)
+        return np.ndarray(shape, dtype=dtype, buffer=mapped, offset=offset)
+
+    def _batch(self, indices):
+        """
+        Reads the rows of one batch, in increasing index order for locality.
+        """
+        indices = np.sort(indices)
+        batch = np.asarray(self.x[indices], dtype=np.float64), np.asarray(self.y[indices], dtype=np.float64)
+        if hasattr(mmap, 'MADV_DONTNEED'):
+            for mapped in self._maps:
+                mapped.madvise(mmap.MADV_DONTNEED)
+        return batch
+
+    def __iter__(self):
+        rows = len(self.x)
+        order = self.rng.permutation(rows) if self.shuffle else np.arange(rows)
+        batches = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for i in range(0, rows, self.batch_size):
+                    item = self._batch(order[i:i+self.batch_size])
+                    while not stop.is_set():
+                        try:
+                            batches.put(item, timeout=0.1)
+                            break
+                        except queue.Full:
+                            pass
+                item = None
+            except BaseException as error:
+                item = error
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+        worker = threading.Thread(target=produce, daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            worker.join()
+
+
+def _shared_views(buffer, shapes, offset=0):
+    """
+    Carves consecutive float64 arrays of the given shapes out of a shared memory buffer.
+    """
+    views = []
+    for shape in shapes:
+        view = np.ndarray(shape, dtype=np.float64, buffer=buffer, offset=offset)
+        views.append(view)
+        offset += view.nbytes
+    return views
+
+
+# State of a data-parallel training worker process
+_worker = {}
+
+
+def _attach_training_worker(layers, activation, names, x_shape, y_shape, size):
+    """
+    Builds the worker's network with its weights and biases viewing the shared parameters.
+    """
+    blocks = {key: shared_memory.SharedMemory(name=name) for key, name in names.items()}
+    network = NeuralNetwork(layers, activation)
+    shapes = network._parameter_shapes()
+    parameters = _shared_views(blocks['parameters'].buf, shapes)
+    network.weights = parameters[:len(network.weights)]
+    network.biases = parameters[len(network.weights):]
+    _worker.update(
+        blocks=blocks,
+        network=network,
+        shapes=shapes,
+        size=size,
+        x=np.ndarray(x_shape, dtype=np.float64, buffer=blocks['x'].buf),
+        y=np.ndarray(y_shape, dtype=np.float64, buffer=blocks['y'].buf),
+    )
+
+
+def _shard_gradients(slot, start, stop):
+    """
+    Computes the gradients of rows [start, stop) into the worker's gradient slot.
+    """
+    network = _worker['network']
+    buffers = network._gradients(_worker['x'][start:stop], _worker['y'][start:stop])
+    views = _shared_views(_worker['blocks']['gradients'].buf, _worker['shapes'], slot * _worker['size'] * 8)
+    for view, gradient in zip(views, buffers['weight_grads'] + buffers['bias_grads']):
+        view[...] = gradient
+
+
+def benchmark(layers=(784, 256, 128, 10), samples=4096, epochs=3, batch_size=32):
+    """
+    Compares epochs/second of the buffered training step with backward.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.random((samples, layers[0]))
+    y = np.eye(layers[-1])[rng.integers(0, layers[-1], samples)]
+
+    results = {}
+    for buffered in (False, True):
+        np.random.seed(0)
+        network = NeuralNetwork(list(layers))
+        start = time.perf_counter()
+        network.train(x, y, epochs=epochs, batch_size=batch_size, lr=0.001, buffered=buffered)
+        elapsed = time.perf_counter() - start
+        results[buffered] = network
+        print(f"buffered={buffered}: {epochs / elapsed:.2f} epochs/s")
+
+    difference = max(np.abs(a - b).max() for a, b in zip(results[False].weights, results[True].weights))
+    print(f"Max weight difference: {difference:.2e}")
+
+
+def benchmark_parallel(layers=(784, 256, 128, 10), samples=8192, epochs=1, batch_size=256, worker_counts=(1, 2, 4, 8)):
+    """
+    Reports training samples/second against the number of worker processes.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.random((samples, layers[0]))
+    y = np.eye(layers[-1])[rng.integers(0, layers[-1], samples)]
+
+    reference = None
+    for workers in worker_counts:
+        np.random.seed(0)
+        network = NeuralNetwork(list(layers))
+        start = time.perf_counter()
+        network.train(x, y, epochs=epochs, batch_size=batch_size, lr=1e-6, workers=workers)
+        elapsed = time.perf_counter() - start
+        reference = reference or network
+        difference = max(np.abs(a - b).max() for a, b in zip(reference.weights, network.weights))
+        print(f"workers={workers}: {samples * epochs / elapsed:.0f} samples/s, max weight difference {difference:.2e}")
+
+
+def benchmark_inference(layers=(784, 256, 128, 10), rows=200_000, chunk_size=8192):
+    """
+    Compares predict throughput of the float64 network with the float32 and int8 engines.
+    """
+    np.random.seed(0)
+    network = NeuralNetwork(list(layers))
+    x = np.random.default_rng(0).random((rows, layers[0]), dtype=np.float32)
+
+    start = time.perf_counter()
+    network.predict(x)
+    baseline = rows / (time.perf_counter() - start)
+    print(f"float64 predict: {baseline:.0f} rows/s")
+
+    for precision in ('float32', 'int8'):
+        engine = network.freeze(precision, chunk_size)
+        start = time.perf_counter()
+        engine.predict(x)
+        throughput = rows / (time.perf_counter() - start)
+        max_error, mismatch = engine.accuracy_delta(x[:10_000])
+        print(f"{precision} engine: {throughput:.0f} rows/s ({throughput / baseline:.1f}x), "
+              f"max output error {max_error:.2e}, argmax mismatch {mismatch:.2%}")
+
+
+def benchmark_serialization(layers=(4096, 2048, 2048, 1024), path='model.bin'):
+    """
+    Times saving a model of roughly 100 MB and memory mapping it back.
+    """
+    np.random.seed(0)
+    network = NeuralNetwork(list(layers))
+    start = time.perf_counter()
+    network.save(path)
+    saved = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loaded = NeuralNetwork.load(path)
+    elapsed = time.perf_counter() - start
+    assert all(np.array_equal(a, b) for a, b in zip(network.weights + network.biases, loaded.weights + loaded.biases))
+    print(f"{os.path.getsize(path) / 2**20:.0f} MB model: save {saved * 1000:.1f} ms, load {elapsed * 1000:.2f} ms")
+    del loaded
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    if "--parallel" in sys.argv:
+        benchmark_parallel()
+    elif "--inference" in sys.argv:
+        benchmark_inference()
+    elif "--serialization" in sys.argv:
+        benchmark_serialization()
+    else:
+        benchmark()
 ```
\ No newline at end of file
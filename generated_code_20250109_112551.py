@@ -1,19 +1,540 @@
 # Task: Write a script to extract data from JSON and create summary reports
 
 ```python
+import argparse
 import json
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
 
-# Load the JSON data into a Python dictionary
-with open('data.json') as f:
+# Size of the blocks read from the input when streaming
+CHUNK_SIZE = 1 << 20
+
+# Size of the byte ranges a JSON-lines input is split into for sharded aggregation. The
+# shards do not depend on the number of workers, so every worker count merges the same
+# partial states in the same order and prints the same report.
+SHARD_SIZE = 64 << 20
+
+# Quantiles reported by the sharded aggregation
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Columnar cache files: magic, version, source size, source mtime (ns), row count and
+# dictionary size, followed by the JSON category dictionary and the code/value columns
+CACHE_MAGIC = b'JCOL'
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct('<4sIQqQI')
+CACHE_ALIGNMENT = 64
+
+# Number of cached rows gathered from the mapped columns at a time when summing
+CACHE_BLOCK = 1 << 16
+
+
+def load_summary(f):
+    """
+    Loads the whole JSON array into a DataFrame and summarizes it with pandas.
+
+    Args:
+        f: Text file containing a JSON array of objects.
+    Returns:
+        The summary DataFrame and the number of rows read.
+    """
+    # Load the JSON data into a Python dictionary
     data = json.load(f)
 
-# Create a pandas DataFrame from the JSON data
-df = pd.DataFrame(data)
+    # Create a pandas DataFrame from the JSON data
+    df = pd.DataFrame(data)
+
+    # Group the data by the 'category' column and calculate the mean of the 'value' column for each group
+    return df.groupby('category').agg({'value': 'mean'}), len(df)
+
+
+def iter_json_array(f, chunk_size=CHUNK_SIZE):
+    """
+    Yields the elements of a top-level JSON array one at a time, reading the input in
+    fixed-size chunks so that memory use does not depend on the size of the array.
+
+    Args:
+        f: Text file containing a JSON array.
+        chunk_size: Number of characters read at a time.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    started = False
+
+    while True:
+        # Skip whitespace and separators between elements
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+        if position == len(buffer):
+            if eof:
+                raise ValueError('Unexpected end of JSON input')
+            buffer = f.read(chunk_size)
+            position = 0
+            eof = not buffer
+            continue
+
+        if not started:
+            if buffer[position] != '[':
+                raise ValueError('Expected a JSON array')
+            started = True
+            position += 1
+            continue
+        if buffer[position] == ']':
+            return
+
+        try:
+            element, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            end = None
+        # An element is only complete once the character after it is already buffered and
+        # ends it; a number cut after '.', 'e' or a sign decodes as a shorter prefix
+        if end is None or (not eof and (end == len(buffer) or buffer[end] not in ' \t\r\n,]')):
+            if eof:
+                raise ValueError('Invalid JSON element')
+            more = f.read(chunk_size)
+            eof = not more
+            buffer = buffer[position:] + more
+            position = 0
+            continue
+
+        yield element
+        position = end
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def stream_summary(f):
+    """
+    Summarizes a JSON array with running per-category sum/count accumulators, without
+    ever holding more than one chunk of the input in memory. Produces the same table
+    as load_summary: rows with a missing category are dropped and missing values are
+    left out of the mean.
+
+    Args:
+        f: Text file containing a JSON array of objects.
+    Returns:
+        The summary DataFrame and the number of rows read.
+    """
+    # category -> [sum, compensation, count]; the sum is compensated like pandas' mean
+    totals = {}
+    rows = 0
+    for row in iter_json_array(f):
+        rows += 1
+        category = row.get('category')
+        if _is_missing(category):
+            continue
+        total = totals.setdefault(category, [0.0, 0.0, 0])
+        value = row.get('value')
+        if _is_missing(value):
+            continue
+        y = value - total[1]
+        t = total[0] + y
+        total[1] = (t - total[0]) - y
+        total[0] = t
+        total[2] += 1
+
+    categories = sorted(totals)
+    means = [totals[c][0] / totals[c][2] if totals[c][2] else math.nan for c in categories]
+    return pd.DataFrame({'value': means}, index=pd.Index(categories, name='category')), rows
+
+
+def _add_exact(partials, x):
+    """
+    Adds x to a list of non-overlapping partial sums (Shewchuk's algorithm, as used by
+    math.fsum). math.fsum(partials) is then the correctly rounded total, whatever order
+    the values and partial lists were combined in.
+    """
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        hi = x + y
+        lo = y - (hi - x)
+        if lo:
+            partials[i] = lo
+            i += 1
+        x = hi
+    partials[i:] = [x]
+
+
+class TDigest:
+    """
+    Merging t-digest: a compact, mergeable sketch of a distribution that answers
+    quantile queries with small error, most accurately near the tails.
+    """
+
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.means = []
+        self.weights = []
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._buffer = []
+
+    def add(self, x):
+        self._buffer.append(x)
+        if len(self._buffer) >= 10 * self.compression:
+            self._compress()
+
+    def merge(self, other):
+        other._compress()
+        self.means += other.means
+        self.weights += other.weights
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._compress()
+
+    def _k(self, q):
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _q_limit(self, q):
+        # Largest quantile a centroid starting at q may extend to (k-scale distance of 1)
+        k = self._k(q) + 1
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(2 * math.pi * k / self.compression) + 1) / 2
+
+    def _compress(self):
+        if self._buffer:
+            self.minimum = min(self.minimum, min(self._buffer))
+            self.maximum = max(self.maximum, max(self._buffer))
+        centroids = sorted(zip(self.means + self._buffer, self.weights + [1] * len(self._buffer)))
+        self._buffer = []
+        if not centroids:
+            return
+        total = sum(weight for _, weight in centroids)
+
+        means, weights = [], []
+        mean, weight = centroids[0]
+        cumulative = 0
+        limit = self._q_limit(0)
+        for next_mean, next_weight in centroids[1:]:
+            if (cumulative + weight + next_weight) / total <= limit:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                cumulative += weight
+                limit = self._q_limit(cumulative / total)
+                mean, weight = next_mean, next_weight
+        means.append(mean)
+        weights.append(weight)
+        self.means, self.weights = means, weights
+
+    def quantile(self, q):
+        self._compress()
+        if not self.means:
+            return math.nan
+        total = sum(self.weights)
+        target = q * total
+        # Interpolate between the centroid centers, pinned to the observed extremes
+        previous_position, previous_value = 0, self.minimum
+        cumulative = 0
+        for mean, weight in zip(self.means, self.weights):
+            position = cumulative + weight / 2
+            if target <= position:
+                if position == previous_position:
+                    return mean
+                fraction = (target - previous_position) / (position - previous_position)
+                return previous_value + fraction * (mean - previous_value)
+            previous_position, previous_value = position, mean
+            cumulative += weight
+        if total == previous_position:
+            return self.maximum
+        fraction = (target - previous_position) / (total - previous_position)
+        return previous_value + fraction * (self.maximum - previous_value)
+
+
+def _new_state():
+    # [count, sum partials, running mean, M2 (sum of squared deviations), min, max, digest];
+    # the exact sum gives the reported mean, the Welford mean and M2 give the variance
+    return [0, [], 0.0, 0.0, math.inf, -math.inf, TDigest()]
+
+
+def _merge_states(states, other):
+    """
+    Merges the per-category partial states of other into states. Means and M2 are
+    combined with Chan et al.'s parallel formula, which avoids the cancellation of a
+    sum-of-squares variance.
+    """
+    for category, (count, sums, mean, m2, minimum, maximum, digest) in other.items():
+        state = states.setdefault(category, _new_state())
+        total = state[0] + count
+        if count:
+            delta = mean - state[2]
+            state[2] += delta * count / total
+            state[3] += m2 + delta * delta * state[0] * count / total
+        state[0] = total
+        for partial in sums:
+            _add_exact(state[1], partial)
+        state[4] = min(state[4], minimum)
+        state[5] = max(state[5], maximum)
+        state[6].merge(digest)
+
+
+def aggregate_shard(path, start, end):
+    """
+    Aggregates the JSON lines that begin inside the byte range [start, end) of a file.
+
+    Args:
+        path: JSON-lines file with one object per line.
+        start: First byte of the range.
+        end: Byte just past the range.
+    Returns:
+        The per-category partial states and the number of rows read.
+    """
+    states = {}
+    rows = 0
+    with open(path, 'rb') as f:
+        if start:
+            # The line straddling start belongs to the previous shard
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            rows += 1
+            row = json.loads(line)
+            category = row.get('category')
+            if _is_missing(category):
+                continue
+            state = states.get(category)
+            if state is None:
+                state = states[category] = _new_state()
+            value = row.get('value')
+            if _is_missing(value):
+                continue
+            state[0] += 1
+            _add_exact(state[1], value)
+            delta = value - state[2]
+            state[2] += delta / state[0]
+            state[3] += delta * (value - state[2])
+            if value < state[4]:
+                state[4] = value
+            if value > state[5]:
+                state[5] = value
+            state[6].add(value)
+    for state in states.values():
+        state[6]._compress()
+    return states, rows
+
+
+def sharded_summary(path, workers=1, shard_size=SHARD_SIZE):
+    """
+    Summarizes a JSON-lines file by aggregating fixed-size byte ranges, in worker
+    processes when workers > 1, and merging their partial states in file order.
+
+    Args:
+        path: JSON-lines file with one object per line.
+        workers: Number of worker processes (1 aggregates in this process).
+        shard_size: Size of the byte ranges in bytes.
+    Returns:
+        The summary DataFrame (count, mean, std, min, quantiles and max per category)
+        and the number of rows read.
+    """
+    size = os.path.getsize(path)
+    starts = list(range(0, size, shard_size))
+    ends = [min(start + shard_size, size) for start in starts]
+    paths = [path] * len(starts)
+
+    if workers > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            partials = list(executor.map(aggregate_shard, paths, starts, ends))
+    else:
+        partials = map(aggregate_shard, paths, starts, ends)
+
+    states = {}
+    rows = 0
+    for shard_states, shard_rows in partials:
+        _merge_states(states, shard_states)
+        rows += shard_rows
+
+    categories = sorted(states)
+    columns = {name: [] for name in ['count', 'mean', 'std', 'min'] + [f'p{round(q * 100)}' for q in QUANTILES] + ['max']}
+    for category in categories:
+        count, sums, _, m2, minimum, maximum, digest = states[category]
+        mean = math.fsum(sums) / count if count else math.nan
+        columns['count'].append(count)
+        columns['mean'].append(mean)
+        columns['std'].append(math.sqrt(m2 / (count - 1)) if count > 1 else math.nan)
+        columns['min'].append(minimum if count else math.nan)
+        for q in QUANTILES:
+            columns[f'p{round(q * 100)}'].append(digest.quantile(q))
+        columns['max'].append(maximum if count else math.nan)
+    return pd.DataFrame(columns, index=pd.Index(categories, name='category')), rows
+
+
+def _cache_key(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _align(offset):
+    return -(-offset // CACHE_ALIGNMENT) * CACHE_ALIGNMENT
+
+
+def write_column_cache(path, cache_path):
+    """
+    Parses a JSON array incrementally and writes its 'category' column (dictionary
+    encoded as int32 codes, -1 when missing) and 'value' column (float64, NaN when
+    missing) to a binary cache file keyed by the source file's size and mtime.
+
+    Args:
+        path: JSON file containing an array of objects.
+        cache_path: Cache file to write.
+    """
+    size, mtime = _cache_key(path)
+    dictionary = {}
+    codes = array('i')
+    values = array('d')
+    with open(path) as f:
+        for row in iter_json_array(f):
+            category = row.get('category')
+            if _is_missing(category):
+                codes.append(-1)
+            else:
+                codes.append(dictionary.setdefault(category, len(dictionary)))
+            value = row.get('value')
+            values.append(math.nan if value is None else float(value))
+
+    categories = json.dumps(list(dictionary)).encode()
+    header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, size, mtime, len(codes), len(categories)) + categories
+    temporary = f'{cache_path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(header.ljust(_align(len(header)), b'\0'))
+        f.write(codes.tobytes())
+        f.write(b'\0' * (_align(f.tell()) - f.tell()))
+        f.write(values.tobytes())
+    os.replace(temporary, cache_path)
+
+
+def read_column_cache(path, cache_path):
+    """
+    Memory maps the columns of a cache file if it matches the source file's size and mtime.
+
+    Args:
+        path: JSON source file.
+        cache_path: Cache file to read.
+    Returns:
+        The categories, the code column and the value column, or None if the cache is
+        missing or stale.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            header = f.read(CACHE_HEADER.size)
+            if len(header) < CACHE_HEADER.size:
+                return None
+            magic, version, size, mtime, rows, dictionary_size = CACHE_HEADER.unpack(header)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION or (size, mtime) != _cache_key(path):
+                return None
+            categories = json.loads(f.read(dictionary_size))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if rows else None
+    except FileNotFoundError:
+        return None
+    if mapped is None:
+        return categories, np.empty(0, dtype=np.int32), np.empty(0)
+    offset = _align(CACHE_HEADER.size + dictionary_size)
+    codes = np.ndarray(rows, dtype='<i4', buffer=mapped, offset=offset)
+    values = np.ndarray(rows, dtype='<f8', buffer=mapped, offset=_align(offset + 4 * rows))
+    return categories, codes, values
+
+
+def cached_summary(path, cache_path=None):
+    """
+    Summarizes a JSON array from its columnar cache, building the cache first if it is
+    missing or the source file has changed since it was written.
+
+    Args:
+        path: JSON file containing an array of objects.
+        cache_path: Cache file (defaults to the source path with a '.colcache' suffix).
+    Returns:
+        The summary DataFrame and the number of rows read.
+    """
+    cache_path = cache_path or path + '.colcache'
+    columns = read_column_cache(path, cache_path)
+    if columns is None:
+        write_column_cache(path, cache_path)
+        columns = read_column_cache(path, cache_path)
+    categories, codes, values = columns
+
+    # Group rows by code, keeping file order within a group (missing categories, code -1,
+    # come first), and sum each group with the same compensated summation as
+    # stream_summary so both match pandas' mean. The row order is the only full-length
+    # array; values are gathered from the mapped column a block at a time.
+    order = np.argsort(codes, kind='stable')
+    sizes = np.zeros(len(categories) + 1, dtype=np.int64)
+    for start in range(0, len(codes), CACHE_BLOCK):
+        sizes += np.bincount(codes[start:start + CACHE_BLOCK] + 1, minlength=len(categories) + 1)
+    bounds = np.cumsum(sizes).tolist()
+    means = {}
+    for category, start, end in zip(categories, bounds, bounds[1:]):
+        total = compensation = 0.0
+        count = 0
+        for block_start in range(start, end, CACHE_BLOCK):
+            block = values[order[block_start:min(block_start + CACHE_BLOCK, end)]]
+            block = block[~np.isnan(block)]
+            count += len(block)
+            for value in block.tolist():
+                y = value - compensation
+                t = total + y
+                compensation = (t - total) - y
+                total = t
+        means[category] = total / count if count else math.nan
+    order = sorted(means)
+    return pd.DataFrame({'value': [means[c] for c in order]}, index=pd.Index(order, name='category')), len(codes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize the mean value per category of a JSON array.')
+    parser.add_argument('path', nargs='?', default='data.json', help="input file, or '-' for stdin")
+    parser.add_argument('--stream', action='store_true', help='parse incrementally with constant memory')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='input is JSON lines; report count/mean/std/min/quantiles/max per category')
+    parser.add_argument('--workers', type=int, default=1, help='worker processes for --jsonl')
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE, help='bytes per --jsonl shard')
+    parser.add_argument('--cache', action='store_true',
+                        help='serve the input from a columnar cache file, building it on first use')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.jsonl:
+        if args.path == '-':
+            parser.error('--jsonl needs a file path')
+        summary, rows = sharded_summary(args.path, args.workers, args.shard_size)
+    elif args.cache:
+        if args.path == '-':
+            parser.error('--cache needs a file path')
+        summary, rows = cached_summary(args.path)
+    else:
+        f = sys.stdin if args.path == '-' else open(args.path)
+        try:
+            summary, rows = stream_summary(f) if args.stream else load_summary(f)
+        finally:
+            if f is not sys.stdin:
+                f.close()
+    elapsed = time.perf_counter() - start
+
+    # Print the summary report
+    print(summary)
+    print(f"Processed {rows} rows in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):.0f} rows/s)", file=sys.stderr)
 
-# Group the data by the 'category' column and calculate the mean of the 'value' column for each group
-summary = df.groupby('category').agg({'value': 'mean'})
 
-# Print the summary report
-print(summary)
+if __name__ == '__main__':
+    main()
 ```
\ No newline at end of file